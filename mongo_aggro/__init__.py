@@ -25,6 +25,9 @@ Expression operators with Python syntax:
     >>> Match(query=Expr((F("status") == "active") & (F("age") > 18)))
 """
 
+from typing import TYPE_CHECKING, Any
+
+from . import expressions
 from .accumulators import (
     Accumulate,
     Accumulator,
@@ -55,162 +58,9 @@ from .base import (
     BaseStage,
     Pipeline,
     SortSpec,
+    serialize_many,
     serialize_value,
 )
-from .expressions import (  # Arithmetic expressions; Set expressions; Comparison expressions; Array expressions; Conditional expressions; Type conversion expressions; Date expressions; Encrypted string expressions; Object expressions; Additional array expressions; Variable expressions; Miscellaneous expressions; Logical expressions; Window expressions; Regex expressions; String expressions
-    AbsExpr,
-    AcosExpr,
-    AcoshExpr,
-    AddExpr,
-    AllElementsTrueExpr,
-    AndExpr,
-    AnyElementTrueExpr,
-    ArrayElemAtExpr,
-    ArraySizeExpr,
-    ArrayToObjectExpr,
-    AsinExpr,
-    AsinhExpr,
-    Atan2Expr,
-    AtanExpr,
-    AtanhExpr,
-    BinarySizeExpr,
-    BitAndExpr,
-    BitNotExpr,
-    BitOrExpr,
-    BitXorExpr,
-    BottomExpr,
-    BottomNWindowExpr,
-    BsonSizeExpr,
-    CeilExpr,
-    CmpExpr,
-    ConcatArraysExpr,
-    ConcatExpr,
-    CondExpr,
-    ConvertExpr,
-    CosExpr,
-    CoshExpr,
-    CovariancePopExpr,
-    CovarianceSampExpr,
-    DateAddExpr,
-    DateDiffExpr,
-    DateFromPartsExpr,
-    DateFromStringExpr,
-    DateSubtractExpr,
-    DateToPartsExpr,
-    DateToStringExpr,
-    DateTruncExpr,
-    DayOfMonthExpr,
-    DayOfWeekExpr,
-    DayOfYearExpr,
-    DegreesToRadiansExpr,
-    DenseRankExpr,
-    DerivativeExpr,
-    DivideExpr,
-    DocumentNumberExpr,
-    EncStrContainsExpr,
-    EncStrEndsWithExpr,
-    EncStrNormalizedEqExpr,
-    EncStrStartsWithExpr,
-    EqExpr,
-    ExpExpr,
-    ExpMovingAvgExpr,
-    ExpressionBase,
-    F,
-    Field,
-    FilterExpr,
-    FirstNExpr,
-    FloorExpr,
-    GetFieldExpr,
-    GteExpr,
-    GtExpr,
-    HourExpr,
-    IfNullExpr,
-    InArrayExpr,
-    IndexOfArrayExpr,
-    IntegralExpr,
-    IsArrayExpr,
-    IsNumberExpr,
-    IsoDayOfWeekExpr,
-    IsoWeekExpr,
-    IsoWeekYearExpr,
-    LastNExpr,
-    LetExpr,
-    LinearFillExpr,
-    LiteralExpr,
-    LnExpr,
-    LocfExpr,
-    Log10Expr,
-    LogExpr,
-    LteExpr,
-    LtExpr,
-    LTrimExpr,
-    MapExpr,
-    MaxNExpr,
-    MergeObjectsExpr,
-    MillisecondExpr,
-    MinNExpr,
-    MinuteExpr,
-    ModExpr,
-    MonthExpr,
-    MultiplyExpr,
-    NeExpr,
-    NotExpr,
-    ObjectToArrayExpr,
-    OrExpr,
-    PowExpr,
-    RadiansToDegreesExpr,
-    RandExpr,
-    RangeExpr,
-    RankExpr,
-    ReduceExpr,
-    RegexFindAllExpr,
-    RegexFindExpr,
-    RegexMatchExpr,
-    ReplaceAllExpr,
-    ReplaceOneExpr,
-    ReverseArrayExpr,
-    RoundExpr,
-    RTrimExpr,
-    SecondExpr,
-    SetDifferenceExpr,
-    SetEqualsExpr,
-    SetFieldExpr,
-    SetIntersectionExpr,
-    SetIsSubsetExpr,
-    SetUnionExpr,
-    ShiftExpr,
-    SinExpr,
-    SinhExpr,
-    SliceExpr,
-    SortArrayExpr,
-    SplitExpr,
-    SqrtExpr,
-    StrCaseCmpExpr,
-    StrLenCPExpr,
-    SubstrCPExpr,
-    SubtractExpr,
-    SwitchBranch,
-    SwitchExpr,
-    TanExpr,
-    TanhExpr,
-    ToBoolExpr,
-    ToDateExpr,
-    ToDecimalExpr,
-    ToDoubleExpr,
-    ToIntExpr,
-    ToLongExpr,
-    ToLowerExpr,
-    ToObjectIdExpr,
-    TopExpr,
-    TopNWindowExpr,
-    ToStringExpr,
-    ToUpperExpr,
-    TrimExpr,
-    TruncExpr,
-    TypeExpr,
-    WeekExpr,
-    YearExpr,
-)
 from .operators import (
     All,
     And,
@@ -293,6 +143,177 @@ from .stages import (
     VectorSearch,
 )
 
+if TYPE_CHECKING:
+    from .expressions import (
+        AbsExpr,
+        AcosExpr,
+        AcoshExpr,
+        AddExpr,
+        AllElementsTrueExpr,
+        AndExpr,
+        AnyElementTrueExpr,
+        ArrayElemAtExpr,
+        ArraySizeExpr,
+        ArrayToObjectExpr,
+        AsinExpr,
+        AsinhExpr,
+        Atan2Expr,
+        AtanExpr,
+        AtanhExpr,
+        BinarySizeExpr,
+        BitAndExpr,
+        BitNotExpr,
+        BitOrExpr,
+        BitXorExpr,
+        BottomExpr,
+        BottomNWindowExpr,
+        BsonSizeExpr,
+        CeilExpr,
+        CmpExpr,
+        ConcatArraysExpr,
+        ConcatExpr,
+        CondExpr,
+        ConvertExpr,
+        CosExpr,
+        CoshExpr,
+        CovariancePopExpr,
+        CovarianceSampExpr,
+        DateAddExpr,
+        DateDiffExpr,
+        DateFromPartsExpr,
+        DateFromStringExpr,
+        DateSubtractExpr,
+        DateToPartsExpr,
+        DateToStringExpr,
+        DateTruncExpr,
+        DayOfMonthExpr,
+        DayOfWeekExpr,
+        DayOfYearExpr,
+        DegreesToRadiansExpr,
+        DenseRankExpr,
+        DerivativeExpr,
+        DivideExpr,
+        DocumentNumberExpr,
+        EncStrContainsExpr,
+        EncStrEndsWithExpr,
+        EncStrNormalizedEqExpr,
+        EncStrStartsWithExpr,
+        EqExpr,
+        ExpExpr,
+        ExpMovingAvgExpr,
+        ExpressionBase,
+        F,
+        Field,
+        FilterExpr,
+        FirstNExpr,
+        FloorExpr,
+        GetFieldExpr,
+        GteExpr,
+        GtExpr,
+        HourExpr,
+        IfNullExpr,
+        InArrayExpr,
+        IndexOfArrayExpr,
+        IntegralExpr,
+        IsArrayExpr,
+        IsNumberExpr,
+        IsoDayOfWeekExpr,
+        IsoWeekExpr,
+        IsoWeekYearExpr,
+        LastNExpr,
+        LetExpr,
+        LinearFillExpr,
+        LiteralExpr,
+        LnExpr,
+        LocfExpr,
+        Log10Expr,
+        LogExpr,
+        LteExpr,
+        LtExpr,
+        LTrimExpr,
+        MapExpr,
+        MaxNExpr,
+        MergeObjectsExpr,
+        MillisecondExpr,
+        MinNExpr,
+        MinuteExpr,
+        ModExpr,
+        MonthExpr,
+        MultiplyExpr,
+        NeExpr,
+        NotExpr,
+        ObjectToArrayExpr,
+        OrExpr,
+        PowExpr,
+        RadiansToDegreesExpr,
+        RandExpr,
+        RangeExpr,
+        RankExpr,
+        ReduceExpr,
+        RegexFindAllExpr,
+        RegexFindExpr,
+        RegexMatchExpr,
+        ReplaceAllExpr,
+        ReplaceOneExpr,
+        ReverseArrayExpr,
+        RoundExpr,
+        RTrimExpr,
+        SecondExpr,
+        SetDifferenceExpr,
+        SetEqualsExpr,
+        SetFieldExpr,
+        SetIntersectionExpr,
+        SetIsSubsetExpr,
+        SetUnionExpr,
+        ShiftExpr,
+        SinExpr,
+        SinhExpr,
+        SliceExpr,
+        SortArrayExpr,
+        SplitExpr,
+        SqrtExpr,
+        StrCaseCmpExpr,
+        StrLenCPExpr,
+        SubstrCPExpr,
+        SubtractExpr,
+        SwitchBranch,
+        SwitchExpr,
+        TanExpr,
+        TanhExpr,
+        ToBoolExpr,
+        ToDateExpr,
+        ToDecimalExpr,
+        ToDoubleExpr,
+        ToIntExpr,
+        ToLongExpr,
+        ToLowerExpr,
+        ToObjectIdExpr,
+        TopExpr,
+        TopNWindowExpr,
+        ToStringExpr,
+        ToUpperExpr,
+        TrimExpr,
+        TruncExpr,
+        TypeExpr,
+        WeekExpr,
+        YearExpr,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve expression operators lazily from mongo_aggro.expressions."""
+    if name not in _EXPRESSIONS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(expressions, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List eagerly and lazily available names."""
+    return sorted(globals().keys() | _EXPRESSIONS)
+
+
 __all__ = [
     # Base classes and types
     "Pipeline",
@@ -300,6 +321,7 @@ __all__ = [
     "SortSpec",
     "AggregationInput",
     "serialize_value",
+    "serialize_many",
     # Sort direction constants
     "ASCENDING",
     "DESCENDING",
@@ -586,3 +608,9 @@ __all__ = [
     "QuerySettings",
     "RankFusion",
 ]
+
+# Expression operators re-exported from mongo_aggro.expressions, which
+# imports its submodules on first use
+_EXPRESSIONS: frozenset[str] = frozenset(expressions.__all__).intersection(
+    __all__
+)
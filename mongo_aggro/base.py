@@ -1,6 +1,7 @@
 """Base classes for MongoDB aggregation pipeline stages."""
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
+from operator import methodcaller
 from typing import TYPE_CHECKING, Any, Protocol, Self, runtime_checkable
 
 from pydantic import BaseModel, GetCoreSchemaHandler
@@ -19,6 +20,61 @@ SortSpec = dict[str, int]
 # Type alias for aggregation input tuple (pipeline, sort)
 AggregationInput = tuple[list[dict[str, Any]], SortSpec]
 
+# Leaf types returned unchanged by serialize_value (exact types only)
+_PRIMITIVE_TYPES: frozenset[type] = frozenset(
+    {str, int, float, bool, type(None)}
+)
+
+
+def _serialize_list(v: list[Any]) -> list[Any]:
+    """Serialize each element of a list."""
+    return [serialize_value(item) for item in v]
+
+
+def _serialize_dict(v: dict[Any, Any]) -> dict[Any, Any]:
+    """Serialize each value of a dict."""
+    return {k: serialize_value(val) for k, val in v.items()}
+
+
+def _passthrough(v: Any) -> Any:
+    """Return values that need no serialization unchanged."""
+    return v
+
+
+def _serializes_directly(cls: type[BaseModel]) -> bool:
+    """Check that serialize() is the model serializer of a model class."""
+    # With any other model serializer registered, model_dump() decides
+    return cls.__pydantic_decorators__.model_serializers.keys() == {
+        "serialize"
+    }
+
+
+# Handler per exact type, filled on first sight of each type
+_SERIALIZERS: dict[type, Callable[[Any], Any]] = {}
+
+
+def _resolve_serializer(cls: type) -> Callable[[Any], Any]:
+    """Pick and cache the serializer handler for a value type."""
+    # Import here to avoid circular imports
+    from mongo_aggro.expressions.base import ExpressionBase, Field
+
+    handler: Callable[[Any], Any]
+    if issubclass(cls, Field):
+        handler = cls.__str__
+    elif issubclass(cls, ExpressionBase) and _serializes_directly(cls):
+        # One walk over the whole tree instead of a pydantic dump per node
+        handler = methodcaller("serialize")
+    elif issubclass(cls, BaseModel):
+        handler = methodcaller("model_dump")
+    elif issubclass(cls, list):
+        handler = _serialize_list
+    elif issubclass(cls, dict):
+        handler = _serialize_dict
+    else:
+        handler = _passthrough
+    _SERIALIZERS[cls] = handler
+    return handler
+
 
 def serialize_value(v: Any) -> Any:
     """
@@ -26,29 +82,50 @@ def serialize_value(v: Any) -> Any:
 
     Handles:
     - Field objects: returns the field path string (e.g., "$status")
-    - BaseModel instances: calls model_dump() for Pydantic serialization
+    - Expressions: calls serialize() directly, skipping model_dump(),
+      when that is the model serializer of their class
+    - Other BaseModel instances: calls model_dump()
     - Lists: recursively serializes each element
     - Dicts: recursively serializes each value
     - Other values: returns as-is
 
+    The handler is looked up by exact type in a table that is filled
+    the first time each type is seen, so the isinstance chain runs
+    once per type rather than once per value.
+
     Args:
         v: Any value to serialize
 
     Returns:
         MongoDB-compatible serialized value
     """
-    # Import here to avoid circular imports
-    from mongo_aggro.expressions import Field
-
-    if isinstance(v, Field):
-        return str(v)
-    elif isinstance(v, BaseModel):
-        return v.model_dump()
-    elif isinstance(v, list):
-        return [serialize_value(item) for item in v]
-    elif isinstance(v, dict):
-        return {k: serialize_value(val) for k, val in v.items()}
-    return v
+    cls = type(v)
+    # Most arguments are literals; skip the table lookup for them
+    if cls in _PRIMITIVE_TYPES:
+        return v
+    handler = _SERIALIZERS.get(cls)
+    if handler is None:
+        handler = _resolve_serializer(cls)
+    return handler(v)
+
+
+def serialize_many(values: Iterable[Any]) -> list[Any]:
+    """
+    Serialize each value of an operand list.
+
+    Equivalent to ``[serialize_value(v) for v in values]`` but drives
+    the loop with map() so variadic operators with long operand lists
+    avoid per-element bytecode dispatch. Elements may be any mix of
+    literals, fields and expressions, so each still goes through
+    serialize_value rather than a blind ``serialize()`` call.
+
+    Args:
+        values: Operands to serialize
+
+    Returns:
+        List of serialized operands
+    """
+    return list(map(serialize_value, values))
 
 
 @runtime_checkable
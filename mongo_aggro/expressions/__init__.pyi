@@ -0,0 +1,28 @@
+# ruff: noqa: F403
+"""Static view of the lazily imported expression operators.
+
+Each submodule's __all__ lists the names re-exported here.
+"""
+
+from mongo_aggro.expressions.arithmetic import *
+from mongo_aggro.expressions.array import *
+from mongo_aggro.expressions.base import ExpressionBase as ExpressionBase
+from mongo_aggro.expressions.base import F as F
+from mongo_aggro.expressions.base import Field as Field
+from mongo_aggro.expressions.base import Layout as Layout
+from mongo_aggro.expressions.bitwise import *
+from mongo_aggro.expressions.comparison import *
+from mongo_aggro.expressions.conditional import *
+from mongo_aggro.expressions.date import *
+from mongo_aggro.expressions.encrypted import *
+from mongo_aggro.expressions.logical import *
+from mongo_aggro.expressions.object import *
+from mongo_aggro.expressions.set import *
+from mongo_aggro.expressions.size import *
+from mongo_aggro.expressions.string import *
+from mongo_aggro.expressions.trigonometry import *
+from mongo_aggro.expressions.type import *
+from mongo_aggro.expressions.variable import *
+from mongo_aggro.expressions.window import *
+
+__all__: list[str]
@@ -2,10 +2,7 @@
 
 from typing import Any
 
-from pydantic import model_serializer
-
-from mongo_aggro.base import serialize_value
-from mongo_aggro.expressions.base import ExpressionBase
+from mongo_aggro.expressions.base import ExpressionBase, Layout
 
 
 class AddExpr(ExpressionBase):
@@ -17,12 +14,11 @@ class AddExpr(ExpressionBase):
         {"$add": ["$price", "$tax"]}
     """
 
-    operands: list[Any]
+    operands: tuple[Any, ...]
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $add expression."""
-        return {"$add": [serialize_value(o) for o in self.operands]}
+    _op = "$add"
+    _layout = Layout.LIST
+    _args = ("operands",)
 
 
 class SubtractExpr(ExpressionBase):
@@ -37,15 +33,9 @@ class SubtractExpr(ExpressionBase):
     left: Any
     right: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $subtract expression."""
-        return {
-            "$subtract": [
-                serialize_value(self.left),
-                serialize_value(self.right),
-            ]
-        }
+    _op = "$subtract"
+    _layout = Layout.POSITIONAL
+    _args = ("left", "right")
 
 
 class MultiplyExpr(ExpressionBase):
@@ -57,12 +47,11 @@ class MultiplyExpr(ExpressionBase):
         {"$multiply": ["$price", "$qty"]}
     """
 
-    operands: list[Any]
+    operands: tuple[Any, ...]
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $multiply expression."""
-        return {"$multiply": [serialize_value(o) for o in self.operands]}
+    _op = "$multiply"
+    _layout = Layout.LIST
+    _args = ("operands",)
 
 
 class DivideExpr(ExpressionBase):
@@ -77,15 +66,9 @@ class DivideExpr(ExpressionBase):
     dividend: Any
     divisor: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $divide expression."""
-        return {
-            "$divide": [
-                serialize_value(self.dividend),
-                serialize_value(self.divisor),
-            ]
-        }
+    _op = "$divide"
+    _layout = Layout.POSITIONAL
+    _args = ("dividend", "divisor")
 
 
 class AbsExpr(ExpressionBase):
@@ -99,10 +82,9 @@ class AbsExpr(ExpressionBase):
 
     value: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $abs expression."""
-        return {"$abs": serialize_value(self.value)}
+    _op = "$abs"
+    _layout = Layout.SINGLE
+    _args = ("value",)
 
 
 class ModExpr(ExpressionBase):
@@ -117,15 +99,9 @@ class ModExpr(ExpressionBase):
     dividend: Any
     divisor: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $mod expression."""
-        return {
-            "$mod": [
-                serialize_value(self.dividend),
-                serialize_value(self.divisor),
-            ]
-        }
+    _op = "$mod"
+    _layout = Layout.POSITIONAL
+    _args = ("dividend", "divisor")
 
 
 class CeilExpr(ExpressionBase):
@@ -139,10 +115,9 @@ class CeilExpr(ExpressionBase):
 
     input: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $ceil expression."""
-        return {"$ceil": serialize_value(self.input)}
+    _op = "$ceil"
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
 class FloorExpr(ExpressionBase):
@@ -156,10 +131,9 @@ class FloorExpr(ExpressionBase):
 
     input: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $floor expression."""
-        return {"$floor": serialize_value(self.input)}
+    _op = "$floor"
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
 class RoundExpr(ExpressionBase):
@@ -174,10 +148,9 @@ class RoundExpr(ExpressionBase):
     input: Any
     place: int = 0
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $round expression."""
-        return {"$round": [serialize_value(self.input), self.place]}
+    _op = "$round"
+    _layout = Layout.POSITIONAL
+    _args = ("input", "place")
 
 
 class TruncExpr(ExpressionBase):
@@ -192,10 +165,9 @@ class TruncExpr(ExpressionBase):
     input: Any
     place: int = 0
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $trunc expression."""
-        return {"$trunc": [serialize_value(self.input), self.place]}
+    _op = "$trunc"
+    _layout = Layout.POSITIONAL
+    _args = ("input", "place")
 
 
 class SqrtExpr(ExpressionBase):
@@ -209,10 +181,9 @@ class SqrtExpr(ExpressionBase):
 
     input: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $sqrt expression."""
-        return {"$sqrt": serialize_value(self.input)}
+    _op = "$sqrt"
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
 class PowExpr(ExpressionBase):
@@ -227,15 +198,9 @@ class PowExpr(ExpressionBase):
     base: Any
     exponent: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $pow expression."""
-        return {
-            "$pow": [
-                serialize_value(self.base),
-                serialize_value(self.exponent),
-            ]
-        }
+    _op = "$pow"
+    _layout = Layout.POSITIONAL
+    _args = ("base", "exponent")
 
 
 class ExpExpr(ExpressionBase):
@@ -249,10 +214,9 @@ class ExpExpr(ExpressionBase):
 
     input: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $exp expression."""
-        return {"$exp": serialize_value(self.input)}
+    _op = "$exp"
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
 class LnExpr(ExpressionBase):
@@ -266,10 +230,9 @@ class LnExpr(ExpressionBase):
 
     input: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $ln expression."""
-        return {"$ln": serialize_value(self.input)}
+    _op = "$ln"
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
 class Log10Expr(ExpressionBase):
@@ -283,10 +246,9 @@ class Log10Expr(ExpressionBase):
 
     input: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $log10 expression."""
-        return {"$log10": serialize_value(self.input)}
+    _op = "$log10"
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
 class LogExpr(ExpressionBase):
@@ -301,12 +263,9 @@ class LogExpr(ExpressionBase):
     input: Any
     base: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $log expression."""
-        return {
-            "$log": [serialize_value(self.input), serialize_value(self.base)]
-        }
+    _op = "$log"
+    _layout = Layout.POSITIONAL
+    _args = ("input", "base")
 
 
 __all__ = [
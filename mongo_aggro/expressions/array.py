@@ -1,11 +1,12 @@
 """Array expression operators for MongoDB aggregation."""
 
+from collections.abc import Callable
 from typing import Any
 
 from pydantic import model_serializer
 
 from mongo_aggro.base import serialize_value
-from mongo_aggro.expressions.base import ExpressionBase
+from mongo_aggro.expressions.base import ExpressionBase, Layout
 
 
 class ArraySizeExpr(ExpressionBase):
@@ -19,10 +20,9 @@ class ArraySizeExpr(ExpressionBase):
 
     array: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $size expression."""
-        return {"$size": serialize_value(self.array)}
+    _op = "$size"
+    _layout = Layout.SINGLE
+    _args = ("array",)
 
 
 class SliceExpr(ExpressionBase):
@@ -41,14 +41,9 @@ class SliceExpr(ExpressionBase):
     n: int
     position: int | None = None
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $slice expression."""
-        if self.position is not None:
-            return {
-                "$slice": [serialize_value(self.array), self.position, self.n]
-            }
-        return {"$slice": [serialize_value(self.array), self.n]}
+    _op = "$slice"
+    _layout = Layout.POSITIONAL
+    _args = ("array", "position", "n")
 
 
 class FilterExpr(ExpressionBase):
@@ -69,19 +64,9 @@ class FilterExpr(ExpressionBase):
     as_: str = "this"
     limit: int | None = None
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $filter expression."""
-        result: dict[str, Any] = {
-            "$filter": {
-                "input": serialize_value(self.input),
-                "as": self.as_,
-                "cond": serialize_value(self.cond),
-            }
-        }
-        if self.limit is not None:
-            result["$filter"]["limit"] = self.limit
-        return result
+    _op = "$filter"
+    _layout = Layout.NAMED
+    _args = ("input", "as_", "cond", "limit")
 
 
 class MapExpr(ExpressionBase):
@@ -101,16 +86,9 @@ class MapExpr(ExpressionBase):
     in_: Any
     as_: str = "this"
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $map expression."""
-        return {
-            "$map": {
-                "input": serialize_value(self.input),
-                "as": self.as_,
-                "in": serialize_value(self.in_),
-            }
-        }
+    _op = "$map"
+    _layout = Layout.NAMED
+    _args = ("input", "as_", "in_")
 
 
 class ReduceExpr(ExpressionBase):
@@ -130,16 +108,9 @@ class ReduceExpr(ExpressionBase):
     initial_value: Any
     in_: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $reduce expression."""
-        return {
-            "$reduce": {
-                "input": serialize_value(self.input),
-                "initialValue": serialize_value(self.initial_value),
-                "in": serialize_value(self.in_),
-            }
-        }
+    _op = "$reduce"
+    _layout = Layout.NAMED
+    _args = ("input", "initial_value", "in_")
 
 
 class ArrayElemAtExpr(ExpressionBase):
@@ -154,15 +125,9 @@ class ArrayElemAtExpr(ExpressionBase):
     array: Any
     index: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $arrayElemAt expression."""
-        return {
-            "$arrayElemAt": [
-                serialize_value(self.array),
-                serialize_value(self.index),
-            ]
-        }
+    _op = "$arrayElemAt"
+    _layout = Layout.POSITIONAL
+    _args = ("array", "index")
 
 
 class ConcatArraysExpr(ExpressionBase):
@@ -174,12 +139,11 @@ class ConcatArraysExpr(ExpressionBase):
         {"$concatArrays": ["$arr1", "$arr2"]}
     """
 
-    arrays: list[Any]
+    arrays: tuple[Any, ...]
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $concatArrays expression."""
-        return {"$concatArrays": [serialize_value(a) for a in self.arrays]}
+    _op = "$concatArrays"
+    _layout = Layout.LIST
+    _args = ("arrays",)
 
 
 class InArrayExpr(ExpressionBase):
@@ -194,12 +158,9 @@ class InArrayExpr(ExpressionBase):
     value: Any
     array: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $in expression."""
-        return {
-            "$in": [serialize_value(self.value), serialize_value(self.array)]
-        }
+    _op = "$in"
+    _layout = Layout.POSITIONAL
+    _args = ("value", "array")
 
 
 class IndexOfArrayExpr(ExpressionBase):
@@ -217,16 +178,18 @@ class IndexOfArrayExpr(ExpressionBase):
     end: int | None = None
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $indexOfArray expression."""
-        args: list[Any] = [
-            serialize_value(self.array),
-            serialize_value(self.value),
-        ]
-        if self.start is not None:
-            args.append(self.start)
-            if self.end is not None:
-                args.append(self.end)
+        array = _sv(self.array)
+        value = _sv(self.value)
+        if self.start is None:
+            args = [array, value]
+        elif self.end is None:
+            args = [array, value, self.start]
+        else:
+            args = [array, value, self.start, self.end]
         return {"$indexOfArray": args}
 
 
@@ -241,10 +204,9 @@ class IsArrayExpr(ExpressionBase):
 
     input: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $isArray expression."""
-        return {"$isArray": serialize_value(self.input)}
+    _op = "$isArray"
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
 class ReverseArrayExpr(ExpressionBase):
@@ -258,10 +220,9 @@ class ReverseArrayExpr(ExpressionBase):
 
     input: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $reverseArray expression."""
-        return {"$reverseArray": serialize_value(self.input)}
+    _op = "$reverseArray"
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
 class SortArrayExpr(ExpressionBase):
@@ -276,15 +237,9 @@ class SortArrayExpr(ExpressionBase):
     input: Any
     sort_by: dict[str, int] | int
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $sortArray expression."""
-        return {
-            "$sortArray": {
-                "input": serialize_value(self.input),
-                "sortBy": self.sort_by,
-            }
-        }
+    _op = "$sortArray"
+    _layout = Layout.NAMED
+    _args = ("input", "sort_by")
 
 
 class RangeExpr(ExpressionBase):
@@ -300,19 +255,26 @@ class RangeExpr(ExpressionBase):
     end: Any
     step: Any = 1
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $range expression."""
-        return {
-            "$range": [
-                serialize_value(self.start),
-                serialize_value(self.end),
-                serialize_value(self.step),
-            ]
-        }
+    _op = "$range"
+    _layout = Layout.POSITIONAL
+    _args = ("start", "end", "step")
 
 
-class FirstNExpr(ExpressionBase):
+class _InputNExpr(ExpressionBase):
+    """
+    Shared base for operators selecting N elements of an array.
+
+    Subclasses only set ``_op``; the fields and NAMED spec live here.
+    """
+
+    input: Any
+    n: Any
+
+    _layout = Layout.NAMED
+    _args = ("input", "n")
+
+
+class FirstNExpr(_InputNExpr):
     """
     $firstN expression operator - returns first N elements of array.
 
@@ -321,21 +283,10 @@ class FirstNExpr(ExpressionBase):
         {"$firstN": {"input": "$items", "n": 3}}
     """
 
-    input: Any
-    n: Any
+    _op = "$firstN"
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $firstN expression."""
-        return {
-            "$firstN": {
-                "input": serialize_value(self.input),
-                "n": serialize_value(self.n),
-            }
-        }
 
-
-class LastNExpr(ExpressionBase):
+class LastNExpr(_InputNExpr):
     """
     $lastN expression operator - returns last N elements of array.
 
@@ -344,21 +295,10 @@ class LastNExpr(ExpressionBase):
         {"$lastN": {"input": "$items", "n": 3}}
     """
 
-    input: Any
-    n: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $lastN expression."""
-        return {
-            "$lastN": {
-                "input": serialize_value(self.input),
-                "n": serialize_value(self.n),
-            }
-        }
+    _op = "$lastN"
 
 
-class MaxNExpr(ExpressionBase):
+class MaxNExpr(_InputNExpr):
     """
     $maxN expression operator - returns N largest values from array.
 
@@ -367,21 +307,10 @@ class MaxNExpr(ExpressionBase):
         {"$maxN": {"input": "$scores", "n": 3}}
     """
 
-    input: Any
-    n: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $maxN expression."""
-        return {
-            "$maxN": {
-                "input": serialize_value(self.input),
-                "n": serialize_value(self.n),
-            }
-        }
+    _op = "$maxN"
 
 
-class MinNExpr(ExpressionBase):
+class MinNExpr(_InputNExpr):
     """
     $minN expression operator - returns N smallest values from array.
 
@@ -390,18 +319,7 @@ class MinNExpr(ExpressionBase):
         {"$minN": {"input": "$scores", "n": 3}}
     """
 
-    input: Any
-    n: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $minN expression."""
-        return {
-            "$minN": {
-                "input": serialize_value(self.input),
-                "n": serialize_value(self.n),
-            }
-        }
+    _op = "$minN"
 
 
 __all__ = [
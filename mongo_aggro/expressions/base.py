@@ -1,10 +1,15 @@
 """Base classes for MongoDB expression operators."""
 
-from typing import TYPE_CHECKING, Any
+import sys
+from collections.abc import Callable
+from enum import StrEnum
+from functools import lru_cache
+from types import CodeType, FunctionType
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, model_serializer
 
-from mongo_aggro.base import serialize_value
+from mongo_aggro.base import serialize_many, serialize_value
 
 if TYPE_CHECKING:
     from mongo_aggro.expressions.comparison import (
@@ -18,6 +23,16 @@ if TYPE_CHECKING:
     from mongo_aggro.expressions.logical import AndExpr, NotExpr, OrExpr
 
 
+def _operator(name: str) -> Any:
+    """
+    Return an operator class through the package's lazy exports.
+
+    The operator modules import this one, so their classes are looked up
+    on the package, which is always imported before this module.
+    """
+    return getattr(sys.modules["mongo_aggro.expressions"], name)
+
+
 class Field:
     """
     Field reference with Python operator overloading support.
@@ -42,10 +57,16 @@ class Field:
         """
         Initialize a field reference.
 
+        The prefixed path is interned, so every reference to the same
+        field shares one string in the serialized output.
+
         Args:
             path: Field path (with or without $ prefix)
         """
-        self._path = path if path.startswith("$") else f"${path}"
+        # str.__str__ turns str subclasses (e.g. enum members) into a
+        # plain str holding the same value, which sys.intern requires
+        path = str.__str__(path)
+        self._path = sys.intern(path if path.startswith("$") else "$" + path)
 
     def __str__(self) -> str:
         """Return the field path with $ prefix."""
@@ -62,47 +83,38 @@ class Field:
     # Comparison operators - return expression objects
     def __eq__(self, other: Any) -> "EqExpr":  # type: ignore[override]
         """Create equality expression: F("field") == value."""
-        from mongo_aggro.expressions.comparison import EqExpr
-
-        return EqExpr(left=self, right=other)
+        return _operator("EqExpr")(left=self, right=other)
 
     def __ne__(self, other: Any) -> "NeExpr":  # type: ignore[override]
         """Create not-equal expression: F("field") != value."""
-        from mongo_aggro.expressions.comparison import NeExpr
-
-        return NeExpr(left=self, right=other)
+        return _operator("NeExpr")(left=self, right=other)
 
     def __gt__(self, other: Any) -> "GtExpr":
         """Create greater-than expression: F("field") > value."""
-        from mongo_aggro.expressions.comparison import GtExpr
-
-        return GtExpr(left=self, right=other)
+        return _operator("GtExpr")(left=self, right=other)
 
     def __ge__(self, other: Any) -> "GteExpr":
         """Create greater-than-or-equal expression: F("field") >= value."""
-        from mongo_aggro.expressions.comparison import GteExpr
-
-        return GteExpr(left=self, right=other)
+        return _operator("GteExpr")(left=self, right=other)
 
     def __lt__(self, other: Any) -> "LtExpr":
         """Create less-than expression: F("field") < value."""
-        from mongo_aggro.expressions.comparison import LtExpr
-
-        return LtExpr(left=self, right=other)
+        return _operator("LtExpr")(left=self, right=other)
 
     def __le__(self, other: Any) -> "LteExpr":
         """Create less-than-or-equal expression: F("field") <= value."""
-        from mongo_aggro.expressions.comparison import LteExpr
-
-        return LteExpr(left=self, right=other)
+        return _operator("LteExpr")(left=self, right=other)
 
 
+@lru_cache(maxsize=1024)
 def F(path: str) -> Field:
     """
     Create a field reference with operator overloading support.
 
     This is the primary way to reference document fields in expressions.
     Returns a Field object that supports Python comparison operators.
+    Fields are immutable, so repeated calls with the same path return
+    the same cached instance: F("status") is F("status").
 
     Args:
         path: Field path (e.g., "status", "user.name", "$existing_ref")
@@ -120,34 +132,248 @@ def F(path: str) -> Field:
     return Field(path)
 
 
+class Layout(StrEnum):
+    """
+    Shape of an operator's arguments in the serialized expression.
+
+    SINGLE: {"$op": arg}
+    LIST: {"$op": [*items]} from a single list field
+    POSITIONAL: {"$op": [arg1, arg2, ...]}
+    NAMED: {"$op": {"key1": arg1, "key2": arg2, ...}}
+    """
+
+    SINGLE = "single"
+    LIST = "list"
+    POSITIONAL = "positional"
+    NAMED = "named"
+
+
+def _to_key(name: str) -> str:
+    """Convert a field name to its MongoDB argument key (in_ -> in)."""
+    head, *rest = name.rstrip("_").split("_")
+    return head + "".join(part.capitalize() for part in rest)
+
+
+def _defaults_to_none(cls: type[BaseModel], name: str) -> bool:
+    """Check whether field `name` of a model being created defaults to None."""
+    if name in cls.__dict__:
+        return cls.__dict__[name] is None
+    if name in cls.__dict__.get("__annotations__", {}):
+        return False
+    for base in cls.__mro__[1:]:
+        field = getattr(base, "__pydantic_fields__", {}).get(name)
+        if field is not None:
+            return not field.is_required() and field.default is None
+    return False
+
+
+def _is_model_serializer(value: Any) -> bool:
+    """Check whether a class attribute is @model_serializer-decorated."""
+    info = getattr(value, "decorator_info", None)
+    return getattr(info, "decorator_repr", None) == "@model_serializer"
+
+
+def _uses_spec_serializer(cls: type[BaseModel]) -> bool:
+    """Check that the class has no hand-written model serializer."""
+    # Pydantic has not collected the class decorators yet, so a model
+    # serializer declared in the class body is still a decorator proxy
+    if any(
+        _is_model_serializer(value)
+        for name, value in cls.__dict__.items()
+        if not name.startswith("__")
+    ):
+        return False
+    # Built bases list their model serializers by name
+    for base in cls.__mro__[1:]:
+        decorators = base.__dict__.get("__pydantic_decorators__")
+        if decorators is not None:
+            return all(
+                getattr(serializer.func, "__generated__", False)
+                for serializer in decorators.model_serializers.values()
+            )
+    return True
+
+
+def _intern_constants(code: CodeType) -> CodeType:
+    """
+    Return code with its string constants interned.
+
+    "$op" and camelCase keys are not identifiers, so the compiler does
+    not intern them; this shares one object per name across all
+    serializers. Nested code objects (comprehensions) are included.
+    """
+    consts = []
+    for const in code.co_consts:
+        if type(const) is str:
+            const = sys.intern(const)
+        elif isinstance(const, CodeType):
+            const = _intern_constants(const)
+        consts.append(const)
+    return code.replace(co_consts=tuple(consts))
+
+
+def _compile_serializer(cls: Any) -> Callable[[Any], dict[str, Any]]:
+    """
+    Generate a serialize() function specialized for the class spec.
+
+    The spec is fixed per class, so the layout dispatch and argument
+    loop are resolved once here: the generated code reads each field
+    once into a local and builds the output in a single literal where
+    possible. Helpers are bound as keyword-only defaults so the body
+    reads them as fast locals instead of global lookups.
+    """
+    op, args, keys = cls._op, cls._args, cls._keys
+    for name in args:
+        if not name.isidentifier():
+            raise ValueError(f"{cls.__name__}._args: invalid name {name!r}")
+    names = [f"v{index}" for index in range(len(args))]
+    lines = [f"{var} = self.{name}" for var, name in zip(names, args)]
+    if cls._layout is Layout.SINGLE:
+        lines.append(f"return {{{op!r}: _sv(v0)}}")
+    elif cls._layout is Layout.LIST:
+        lines.append(f"return {{{op!r}: _many(v0)}}")
+    else:
+        positional = cls._layout is Layout.POSITIONAL
+        head = 0
+        while head < len(args) and args[head] not in cls._optional:
+            head += 1
+        if positional:
+            items = (f"_sv({var})" for var in names[:head])
+            lines.append(f"args = [{', '.join(items)}]")
+        else:
+            items = (
+                f"{key!r}: _sv({var})"
+                for var, key in zip(names[:head], keys[:head])
+            )
+            lines.append(f"args = {{{', '.join(items)}}}")
+        for name, var, key in zip(args[head:], names[head:], keys[head:]):
+            store = (
+                "args.append({})" if positional else f"args[{key!r}] = {{}}"
+            )
+            if name in cls._optional:
+                lines.append(f"if {var} is not None:")
+                lines.append("    " + store.format(f"_sv({var})"))
+            else:
+                lines.append(store.format(f"_sv({var})"))
+        lines.append(f"return {{{op!r}: args}}")
+    source = "".join(
+        f"{line}\n"
+        for line in (
+            "def serialize(",
+            "    self, *, _sv=serialize_value, _many=serialize_many",
+            "):",
+            *(f"    {line}" for line in lines),
+        )
+    )
+    namespace: dict[str, Any] = {
+        "serialize_value": serialize_value,
+        "serialize_many": serialize_many,
+    }
+    exec(source, namespace)  # noqa: S102 - source built from class spec
+    function = namespace["serialize"]
+    function.__code__ = _intern_constants(function.__code__)
+    function.__module__ = cls.__module__
+    function.__qualname__ = f"{cls.__qualname__}.serialize"
+    function.__doc__ = f"Serialize to MongoDB {op} expression."
+    function.__generated__ = True
+    return function
+
+
 class ExpressionBase(BaseModel):
     """
     Base class for all MongoDB expression operators.
 
     Provides logical operator support (&, |, ~) for combining expressions.
     All expression subclasses should inherit from this class.
+
+    Simple operators describe their output with class-level attributes
+    instead of defining their own serializer:
+
+        _op: operator name, e.g. "$setDifference"
+        _layout: argument shape (see Layout)
+        _args: field names, in output order
+        _keys: output keys for NAMED layouts (derived from _args)
+
+    Optional arguments (fields defaulting to None) are omitted from
+    POSITIONAL and NAMED output when unset.
+
+    Schema construction is deferred until a class is first instantiated,
+    so importing the package does not build validators for every
+    expression operator up front.
+
+    Expressions are immutable once built; combine or rebuild them
+    instead of assigning to fields.
     """
 
     model_config = ConfigDict(
         populate_by_name=True,
         extra="forbid",
         arbitrary_types_allowed=True,
+        defer_build=True,
+        frozen=True,
     )
 
+    _op: ClassVar[str]
+    _layout: ClassVar[Layout] = Layout.SINGLE
+    _args: ClassVar[tuple[str, ...]] = ()
+    _keys: ClassVar[tuple[str, ...]] = ()
+    _optional: ClassVar[frozenset[str]] = frozenset()
+    # Set on AndExpr/OrExpr so & and | can flatten without isinstance
+    _is_and: ClassVar[bool] = False
+    _is_or: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Compile a serializer for the class spec.
+
+        Runs before pydantic collects the class decorators, so the
+        generated function is registered as the model serializer.
+        Classes registering a model serializer of their own, under any
+        name, keep it; a hand-written serialize() also has its string
+        constants interned like those of generated code.
+        """
+        super().__init_subclass__(**kwargs)
+        if "_op" in cls.__dict__:
+            cls._op = sys.intern(cls._op)
+        if "_args" in cls.__dict__ and "_keys" not in cls.__dict__:
+            cls._keys = tuple(map(_to_key, cls._args))
+        cls._optional = frozenset(
+            name for name in cls._args if _defaults_to_none(cls, name)
+        )
+        if hasattr(cls, "_op") and _uses_spec_serializer(cls):
+            cls.serialize = model_serializer(_compile_serializer(cls))
+        elif "serialize" in cls.__dict__:
+            method = cls.__dict__["serialize"]
+            function = getattr(method, "wrapped", method)
+            if isinstance(function, FunctionType):
+                function.__code__ = _intern_constants(function.__code__)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize to a MongoDB expression dict.
+
+        Walks the tree with the same serializers as model_dump(), without
+        pydantic's keyword handling.
+
+        Example:
+            >>> (F("age") > 18).to_dict()
+            {"$gt": ["$age", 18]}
+        """
+        return serialize_value(self)
+
     def __and__(self, other: "ExpressionBase | dict[str, Any]") -> "AndExpr":
         """
         Combine expressions with AND: expr1 & expr2.
 
         Automatically flattens nested ANDs for cleaner output.
         """
-        from mongo_aggro.expressions.logical import AndExpr
-
-        left = self.conditions if isinstance(self, AndExpr) else [self]
-        if isinstance(other, AndExpr):
-            right = other.conditions
+        # The flag marks AndExpr, so the casts only inform the checker
+        left = cast("AndExpr", self).conditions if self._is_and else (self,)
+        if getattr(other, "_is_and", False):
+            right = cast("AndExpr", other).conditions
         else:
-            right = [other]
-        return AndExpr(conditions=left + right)
+            right = (other,)
+        return _operator("AndExpr")(conditions=left + right)
 
     def __or__(self, other: "ExpressionBase | dict[str, Any]") -> "OrExpr":
         """
@@ -155,26 +381,38 @@ class ExpressionBase(BaseModel):
 
         Automatically flattens nested ORs for cleaner output.
         """
-        from mongo_aggro.expressions.logical import OrExpr
-
-        left = self.conditions if isinstance(self, OrExpr) else [self]
-        if isinstance(other, OrExpr):
-            right = other.conditions
+        # The flag marks OrExpr, so the casts only inform the checker
+        left = cast("OrExpr", self).conditions if self._is_or else (self,)
+        if getattr(other, "_is_or", False):
+            right = cast("OrExpr", other).conditions
         else:
-            right = [other]
-        return OrExpr(conditions=left + right)
+            right = (other,)
+        return _operator("OrExpr")(conditions=left + right)
 
     def __invert__(self) -> "NotExpr":
         """Negate expression with NOT: ~expr."""
-        from mongo_aggro.expressions.logical import NotExpr
+        return _operator("NotExpr")(condition=self)
+
+
+class _UnaryExpr(ExpressionBase):
+    """
+    Shared base for operators taking a single ``input`` argument.
+
+    Subclasses only set ``_op``; the field and SINGLE spec live here.
+    """
+
+    input: Any
 
-        return NotExpr(condition=self)
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
-# Re-export serialize_value for use by expression modules
+# Re-export serializers for use by expression modules
 __all__ = [
     "Field",
     "F",
+    "Layout",
     "ExpressionBase",
     "serialize_value",
+    "serialize_many",
 ]
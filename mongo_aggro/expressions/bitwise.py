@@ -2,10 +2,7 @@
 
 from typing import Any
 
-from pydantic import model_serializer
-
-from mongo_aggro.base import serialize_value
-from mongo_aggro.expressions.base import ExpressionBase
+from mongo_aggro.expressions.base import ExpressionBase, Layout
 
 
 class BitAndExpr(ExpressionBase):
@@ -17,12 +14,11 @@ class BitAndExpr(ExpressionBase):
         {"$bitAnd": ["$a", "$b"]}
     """
 
-    operands: list[Any]
+    operands: tuple[Any, ...]
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $bitAnd expression."""
-        return {"$bitAnd": [serialize_value(o) for o in self.operands]}
+    _op = "$bitAnd"
+    _layout = Layout.LIST
+    _args = ("operands",)
 
 
 class BitOrExpr(ExpressionBase):
@@ -34,12 +30,11 @@ class BitOrExpr(ExpressionBase):
         {"$bitOr": ["$a", "$b"]}
     """
 
-    operands: list[Any]
+    operands: tuple[Any, ...]
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $bitOr expression."""
-        return {"$bitOr": [serialize_value(o) for o in self.operands]}
+    _op = "$bitOr"
+    _layout = Layout.LIST
+    _args = ("operands",)
 
 
 class BitXorExpr(ExpressionBase):
@@ -51,12 +46,11 @@ class BitXorExpr(ExpressionBase):
         {"$bitXor": ["$a", "$b"]}
     """
 
-    operands: list[Any]
+    operands: tuple[Any, ...]
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $bitXor expression."""
-        return {"$bitXor": [serialize_value(o) for o in self.operands]}
+    _op = "$bitXor"
+    _layout = Layout.LIST
+    _args = ("operands",)
 
 
 class BitNotExpr(ExpressionBase):
@@ -70,10 +64,9 @@ class BitNotExpr(ExpressionBase):
 
     input: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $bitNot expression."""
-        return {"$bitNot": serialize_value(self.input)}
+    _op = "$bitNot"
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
 __all__ = [
@@ -1,5 +1,6 @@
 """Comparison expression operators for MongoDB aggregation."""
 
+from collections.abc import Callable
 from typing import Any
 
 from pydantic import model_serializer
@@ -8,27 +9,37 @@ from mongo_aggro.base import serialize_value
 from mongo_aggro.expressions.base import ExpressionBase
 
 
-class EqExpr(ExpressionBase):
+class _ComparisonExpr(ExpressionBase):
     """
-    $eq expression operator - tests equality.
+    Shared base for two-operand comparison operators.
 
-    Example:
-        >>> EqExpr(left=F("status"), right="active").model_dump()
-        {"$eq": ["$status", "active"]}
+    Subclasses only set ``_op`` and share this hand-written serializer.
     """
 
     left: Any
     right: Any
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $eq expression."""
-        return {
-            "$eq": [serialize_value(self.left), serialize_value(self.right)]
-        }
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
+        """Serialize to MongoDB comparison expression."""
+        return {self._op: [_sv(self.left), _sv(self.right)]}
+
 
+class EqExpr(_ComparisonExpr):
+    """
+    $eq expression operator - tests equality.
 
-class NeExpr(ExpressionBase):
+    Example:
+        >>> EqExpr(left=F("status"), right="active").model_dump()
+        {"$eq": ["$status", "active"]}
+    """
+
+    _op = "$eq"
+
+
+class NeExpr(_ComparisonExpr):
     """
     $ne expression operator - tests inequality.
 
@@ -37,18 +48,10 @@ class NeExpr(ExpressionBase):
         {"$ne": ["$status", "deleted"]}
     """
 
-    left: Any
-    right: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $ne expression."""
-        return {
-            "$ne": [serialize_value(self.left), serialize_value(self.right)]
-        }
+    _op = "$ne"
 
 
-class GtExpr(ExpressionBase):
+class GtExpr(_ComparisonExpr):
     """
     $gt expression operator - tests greater than.
 
@@ -57,18 +60,10 @@ class GtExpr(ExpressionBase):
         {"$gt": ["$age", 18]}
     """
 
-    left: Any
-    right: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $gt expression."""
-        return {
-            "$gt": [serialize_value(self.left), serialize_value(self.right)]
-        }
+    _op = "$gt"
 
 
-class GteExpr(ExpressionBase):
+class GteExpr(_ComparisonExpr):
     """
     $gte expression operator - tests greater than or equal.
 
@@ -77,18 +72,10 @@ class GteExpr(ExpressionBase):
         {"$gte": ["$age", 18]}
     """
 
-    left: Any
-    right: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $gte expression."""
-        return {
-            "$gte": [serialize_value(self.left), serialize_value(self.right)]
-        }
+    _op = "$gte"
 
 
-class LtExpr(ExpressionBase):
+class LtExpr(_ComparisonExpr):
     """
     $lt expression operator - tests less than.
 
@@ -97,18 +84,10 @@ class LtExpr(ExpressionBase):
         {"$lt": ["$age", 65]}
     """
 
-    left: Any
-    right: Any
+    _op = "$lt"
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $lt expression."""
-        return {
-            "$lt": [serialize_value(self.left), serialize_value(self.right)]
-        }
 
-
-class LteExpr(ExpressionBase):
+class LteExpr(_ComparisonExpr):
     """
     $lte expression operator - tests less than or equal.
 
@@ -117,18 +96,10 @@ class LteExpr(ExpressionBase):
         {"$lte": ["$age", 65]}
     """
 
-    left: Any
-    right: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $lte expression."""
-        return {
-            "$lte": [serialize_value(self.left), serialize_value(self.right)]
-        }
+    _op = "$lte"
 
 
-class CmpExpr(ExpressionBase):
+class CmpExpr(_ComparisonExpr):
     """
     $cmp expression operator - compares two values.
 
@@ -139,15 +110,7 @@ class CmpExpr(ExpressionBase):
         {"$cmp": ["$a", "$b"]}
     """
 
-    left: Any
-    right: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $cmp expression."""
-        return {
-            "$cmp": [serialize_value(self.left), serialize_value(self.right)]
-        }
+    _op = "$cmp"
 
 
 __all__ = [
@@ -1,11 +1,12 @@
 """Conditional expression operators for MongoDB aggregation."""
 
-from typing import Any
+from collections.abc import Callable
+from typing import Any, NamedTuple
 
-from pydantic import BaseModel, ConfigDict, model_serializer
+from pydantic import model_serializer
 
 from mongo_aggro.base import serialize_value
-from mongo_aggro.expressions.base import ExpressionBase
+from mongo_aggro.expressions.base import ExpressionBase, Layout
 
 
 class CondExpr(ExpressionBase):
@@ -25,16 +26,9 @@ class CondExpr(ExpressionBase):
     then: Any
     else_: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $cond expression."""
-        return {
-            "$cond": {
-                "if": serialize_value(self.if_),
-                "then": serialize_value(self.then),
-                "else": serialize_value(self.else_),
-            }
-        }
+    _op = "$cond"
+    _layout = Layout.NAMED
+    _args = ("if_", "then", "else_")
 
 
 class IfNullExpr(ExpressionBase):
@@ -49,24 +43,18 @@ class IfNullExpr(ExpressionBase):
     input: Any
     replacement: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $ifNull expression."""
-        return {
-            "$ifNull": [
-                serialize_value(self.input),
-                serialize_value(self.replacement),
-            ]
-        }
+    _op = "$ifNull"
+    _layout = Layout.POSITIONAL
+    _args = ("input", "replacement")
 
 
-class SwitchBranch(BaseModel):
-    """A single branch in a $switch expression."""
+class SwitchBranch(NamedTuple):
+    """
+    A single branch in a $switch expression.
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        extra="forbid",
-    )
+    A plain named tuple rather than a model: branches are only holders
+    for two expressions, so they skip per-branch validation.
+    """
 
     case: Any
     then: Any
@@ -91,21 +79,23 @@ class SwitchExpr(ExpressionBase):
     default: Any = None
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $switch expression."""
         result: dict[str, Any] = {
             "$switch": {
                 "branches": [
                     {
-                        "case": serialize_value(b.case),
-                        "then": serialize_value(b.then),
+                        "case": _sv(b.case),
+                        "then": _sv(b.then),
                     }
                     for b in self.branches
                 ]
             }
         }
         if self.default is not None:
-            result["$switch"]["default"] = serialize_value(self.default)
+            result["$switch"]["default"] = _sv(self.default)
         return result
 
 
@@ -1,11 +1,13 @@
 """Date expression operators for MongoDB aggregation."""
 
+import sys
+from collections.abc import Callable
 from typing import Any
 
-from pydantic import model_serializer
+from pydantic import field_validator, model_serializer
 
 from mongo_aggro.base import serialize_value
-from mongo_aggro.expressions.base import ExpressionBase
+from mongo_aggro.expressions.base import ExpressionBase, Layout
 
 
 class DateAddExpr(ExpressionBase):
@@ -26,19 +28,9 @@ class DateAddExpr(ExpressionBase):
     amount: Any
     timezone: str | None = None
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $dateAdd expression."""
-        result: dict[str, Any] = {
-            "$dateAdd": {
-                "startDate": serialize_value(self.start_date),
-                "unit": self.unit,
-                "amount": serialize_value(self.amount),
-            }
-        }
-        if self.timezone:
-            result["$dateAdd"]["timezone"] = self.timezone
-        return result
+    _op = "$dateAdd"
+    _layout = Layout.NAMED
+    _args = ("start_date", "unit", "amount", "timezone")
 
 
 class DateSubtractExpr(ExpressionBase):
@@ -59,19 +51,9 @@ class DateSubtractExpr(ExpressionBase):
     amount: Any
     timezone: str | None = None
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $dateSubtract expression."""
-        result: dict[str, Any] = {
-            "$dateSubtract": {
-                "startDate": serialize_value(self.start_date),
-                "unit": self.unit,
-                "amount": serialize_value(self.amount),
-            }
-        }
-        if self.timezone:
-            result["$dateSubtract"]["timezone"] = self.timezone
-        return result
+    _op = "$dateSubtract"
+    _layout = Layout.NAMED
+    _args = ("start_date", "unit", "amount", "timezone")
 
 
 class DateDiffExpr(ExpressionBase):
@@ -93,21 +75,9 @@ class DateDiffExpr(ExpressionBase):
     timezone: str | None = None
     start_of_week: str | None = None
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $dateDiff expression."""
-        result: dict[str, Any] = {
-            "$dateDiff": {
-                "startDate": serialize_value(self.start_date),
-                "endDate": serialize_value(self.end_date),
-                "unit": self.unit,
-            }
-        }
-        if self.timezone:
-            result["$dateDiff"]["timezone"] = self.timezone
-        if self.start_of_week:
-            result["$dateDiff"]["startOfWeek"] = self.start_of_week
-        return result
+    _op = "$dateDiff"
+    _layout = Layout.NAMED
+    _args = ("start_date", "end_date", "unit", "timezone", "start_of_week")
 
 
 class DateToStringExpr(ExpressionBase):
@@ -127,21 +97,9 @@ class DateToStringExpr(ExpressionBase):
     timezone: str | None = None
     on_null: Any = None
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $dateToString expression."""
-        result: dict[str, Any] = {
-            "$dateToString": {
-                "date": serialize_value(self.date),
-            }
-        }
-        if self.format:
-            result["$dateToString"]["format"] = self.format
-        if self.timezone:
-            result["$dateToString"]["timezone"] = self.timezone
-        if self.on_null is not None:
-            result["$dateToString"]["onNull"] = serialize_value(self.on_null)
-        return result
+    _op = "$dateToString"
+    _layout = Layout.NAMED
+    _args = ("date", "format", "timezone", "on_null")
 
 
 class DateFromStringExpr(ExpressionBase):
@@ -162,25 +120,9 @@ class DateFromStringExpr(ExpressionBase):
     on_error: Any = None
     on_null: Any = None
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $dateFromString expression."""
-        result: dict[str, Any] = {
-            "$dateFromString": {
-                "dateString": serialize_value(self.date_string),
-            }
-        }
-        if self.format:
-            result["$dateFromString"]["format"] = self.format
-        if self.timezone:
-            result["$dateFromString"]["timezone"] = self.timezone
-        if self.on_error is not None:
-            result["$dateFromString"]["onError"] = serialize_value(
-                self.on_error
-            )
-        if self.on_null is not None:
-            result["$dateFromString"]["onNull"] = serialize_value(self.on_null)
-        return result
+    _op = "$dateFromString"
+    _layout = Layout.NAMED
+    _args = ("date_string", "format", "timezone", "on_error", "on_null")
 
 
 class ToDateExpr(ExpressionBase):
@@ -194,38 +136,48 @@ class ToDateExpr(ExpressionBase):
 
     input: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $toDate expression."""
-        return {"$toDate": serialize_value(self.input)}
+    _op = "$toDate"
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
-class YearExpr(ExpressionBase):
+class _DatePartExpr(ExpressionBase):
     """
-    $year expression operator - extracts year from date.
+    Shared base for date part extraction operators ($year, $hour, ...).
 
-    Example:
-        >>> YearExpr(date=F("createdAt")).model_dump()
-        {"$year": "$createdAt"}
+    Serializes to the bare date when no timezone is given and to the
+    {"date": ..., "timezone": ...} document form otherwise. Subclasses
+    only set ``_op``. serialize_value is bound as a default so the
+    shared serializer reads it as a local.
     """
 
     date: Any
     timezone: str | None = None
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $year expression."""
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
+        """Serialize to the MongoDB date part expression."""
+        date = _sv(self.date)
         if self.timezone is None:
-            return {"$year": serialize_value(self.date)}
-        return {
-            "$year": {
-                "date": serialize_value(self.date),
-                "timezone": self.timezone,
-            }
-        }
+            return {self._op: date}
+        return {self._op: {"date": date, "timezone": self.timezone}}
+
 
+class YearExpr(_DatePartExpr):
+    """
+    $year expression operator - extracts year from date.
 
-class MonthExpr(ExpressionBase):
+    Example:
+        >>> YearExpr(date=F("createdAt")).model_dump()
+        {"$year": "$createdAt"}
+    """
+
+    _op = "$year"
+
+
+class MonthExpr(_DatePartExpr):
     """
     $month expression operator - extracts month (1-12) from date.
 
@@ -234,23 +186,10 @@ class MonthExpr(ExpressionBase):
         {"$month": "$createdAt"}
     """
 
-    date: Any
-    timezone: str | None = None
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $month expression."""
-        if self.timezone is None:
-            return {"$month": serialize_value(self.date)}
-        return {
-            "$month": {
-                "date": serialize_value(self.date),
-                "timezone": self.timezone,
-            }
-        }
+    _op = "$month"
 
 
-class DayOfMonthExpr(ExpressionBase):
+class DayOfMonthExpr(_DatePartExpr):
     """
     $dayOfMonth expression operator - extracts day of month (1-31).
 
@@ -259,23 +198,10 @@ class DayOfMonthExpr(ExpressionBase):
         {"$dayOfMonth": "$createdAt"}
     """
 
-    date: Any
-    timezone: str | None = None
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $dayOfMonth expression."""
-        if self.timezone is None:
-            return {"$dayOfMonth": serialize_value(self.date)}
-        return {
-            "$dayOfMonth": {
-                "date": serialize_value(self.date),
-                "timezone": self.timezone,
-            }
-        }
+    _op = "$dayOfMonth"
 
 
-class DayOfWeekExpr(ExpressionBase):
+class DayOfWeekExpr(_DatePartExpr):
     """
     $dayOfWeek expression operator - extracts day of week (1=Sun, 7=Sat).
 
@@ -284,23 +210,10 @@ class DayOfWeekExpr(ExpressionBase):
         {"$dayOfWeek": "$createdAt"}
     """
 
-    date: Any
-    timezone: str | None = None
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $dayOfWeek expression."""
-        if self.timezone is None:
-            return {"$dayOfWeek": serialize_value(self.date)}
-        return {
-            "$dayOfWeek": {
-                "date": serialize_value(self.date),
-                "timezone": self.timezone,
-            }
-        }
+    _op = "$dayOfWeek"
 
 
-class DayOfYearExpr(ExpressionBase):
+class DayOfYearExpr(_DatePartExpr):
     """
     $dayOfYear expression operator - extracts day of year (1-366).
 
@@ -309,23 +222,10 @@ class DayOfYearExpr(ExpressionBase):
         {"$dayOfYear": "$createdAt"}
     """
 
-    date: Any
-    timezone: str | None = None
+    _op = "$dayOfYear"
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $dayOfYear expression."""
-        if self.timezone is None:
-            return {"$dayOfYear": serialize_value(self.date)}
-        return {
-            "$dayOfYear": {
-                "date": serialize_value(self.date),
-                "timezone": self.timezone,
-            }
-        }
 
-
-class HourExpr(ExpressionBase):
+class HourExpr(_DatePartExpr):
     """
     $hour expression operator - extracts hour (0-23) from date.
 
@@ -334,23 +234,10 @@ class HourExpr(ExpressionBase):
         {"$hour": "$createdAt"}
     """
 
-    date: Any
-    timezone: str | None = None
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $hour expression."""
-        if self.timezone is None:
-            return {"$hour": serialize_value(self.date)}
-        return {
-            "$hour": {
-                "date": serialize_value(self.date),
-                "timezone": self.timezone,
-            }
-        }
+    _op = "$hour"
 
 
-class MinuteExpr(ExpressionBase):
+class MinuteExpr(_DatePartExpr):
     """
     $minute expression operator - extracts minute (0-59) from date.
 
@@ -359,23 +246,10 @@ class MinuteExpr(ExpressionBase):
         {"$minute": "$createdAt"}
     """
 
-    date: Any
-    timezone: str | None = None
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $minute expression."""
-        if self.timezone is None:
-            return {"$minute": serialize_value(self.date)}
-        return {
-            "$minute": {
-                "date": serialize_value(self.date),
-                "timezone": self.timezone,
-            }
-        }
+    _op = "$minute"
 
 
-class SecondExpr(ExpressionBase):
+class SecondExpr(_DatePartExpr):
     """
     $second expression operator - extracts second (0-60) from date.
 
@@ -384,23 +258,10 @@ class SecondExpr(ExpressionBase):
         {"$second": "$createdAt"}
     """
 
-    date: Any
-    timezone: str | None = None
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $second expression."""
-        if self.timezone is None:
-            return {"$second": serialize_value(self.date)}
-        return {
-            "$second": {
-                "date": serialize_value(self.date),
-                "timezone": self.timezone,
-            }
-        }
+    _op = "$second"
 
 
-class MillisecondExpr(ExpressionBase):
+class MillisecondExpr(_DatePartExpr):
     """
     $millisecond expression operator - extracts milliseconds (0-999).
 
@@ -409,23 +270,10 @@ class MillisecondExpr(ExpressionBase):
         {"$millisecond": "$createdAt"}
     """
 
-    date: Any
-    timezone: str | None = None
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $millisecond expression."""
-        if self.timezone is None:
-            return {"$millisecond": serialize_value(self.date)}
-        return {
-            "$millisecond": {
-                "date": serialize_value(self.date),
-                "timezone": self.timezone,
-            }
-        }
+    _op = "$millisecond"
 
 
-class WeekExpr(ExpressionBase):
+class WeekExpr(_DatePartExpr):
     """
     $week expression operator - extracts week number (0-53).
 
@@ -434,23 +282,10 @@ class WeekExpr(ExpressionBase):
         {"$week": "$createdAt"}
     """
 
-    date: Any
-    timezone: str | None = None
+    _op = "$week"
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $week expression."""
-        if self.timezone is None:
-            return {"$week": serialize_value(self.date)}
-        return {
-            "$week": {
-                "date": serialize_value(self.date),
-                "timezone": self.timezone,
-            }
-        }
 
-
-class IsoWeekExpr(ExpressionBase):
+class IsoWeekExpr(_DatePartExpr):
     """
     $isoWeek expression operator - extracts ISO week number (1-53).
 
@@ -459,23 +294,10 @@ class IsoWeekExpr(ExpressionBase):
         {"$isoWeek": "$createdAt"}
     """
 
-    date: Any
-    timezone: str | None = None
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $isoWeek expression."""
-        if self.timezone is None:
-            return {"$isoWeek": serialize_value(self.date)}
-        return {
-            "$isoWeek": {
-                "date": serialize_value(self.date),
-                "timezone": self.timezone,
-            }
-        }
+    _op = "$isoWeek"
 
 
-class IsoWeekYearExpr(ExpressionBase):
+class IsoWeekYearExpr(_DatePartExpr):
     """
     $isoWeekYear expression operator - extracts ISO week year.
 
@@ -484,23 +306,10 @@ class IsoWeekYearExpr(ExpressionBase):
         {"$isoWeekYear": "$createdAt"}
     """
 
-    date: Any
-    timezone: str | None = None
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $isoWeekYear expression."""
-        if self.timezone is None:
-            return {"$isoWeekYear": serialize_value(self.date)}
-        return {
-            "$isoWeekYear": {
-                "date": serialize_value(self.date),
-                "timezone": self.timezone,
-            }
-        }
+    _op = "$isoWeekYear"
 
 
-class IsoDayOfWeekExpr(ExpressionBase):
+class IsoDayOfWeekExpr(_DatePartExpr):
     """
     $isoDayOfWeek expression operator - extracts ISO day of week (1=Mon, 7=Sun).
 
@@ -509,20 +318,23 @@ class IsoDayOfWeekExpr(ExpressionBase):
         {"$isoDayOfWeek": "$createdAt"}
     """
 
-    date: Any
-    timezone: str | None = None
+    _op = "$isoDayOfWeek"
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $isoDayOfWeek expression."""
-        if self.timezone is None:
-            return {"$isoDayOfWeek": serialize_value(self.date)}
-        return {
-            "$isoDayOfWeek": {
-                "date": serialize_value(self.date),
-                "timezone": self.timezone,
-            }
-        }
+
+# Optional $dateFromParts arguments as (key, field) pairs, in output order
+_TIME_PARTS = (
+    ("hour", "hour"),
+    ("minute", "minute"),
+    ("second", "second"),
+    ("millisecond", "millisecond"),
+    ("timezone", "timezone"),
+)
+_CALENDAR_PARTS = (("month", "month"), ("day", "day"), *_TIME_PARTS)
+_ISO_WEEK_PARTS = (
+    ("isoWeek", "iso_week"),
+    ("isoDayOfWeek", "iso_day_of_week"),
+    *_TIME_PARTS,
+)
 
 
 class DateFromPartsExpr(ExpressionBase):
@@ -547,40 +359,21 @@ class DateFromPartsExpr(ExpressionBase):
     iso_week: Any | None = None
     iso_day_of_week: Any | None = None
 
-    def _add_date_parts(self, result: dict[str, Any]) -> None:
-        """Add date part fields to result dict."""
-        if self.iso_week_year is not None:
-            result["isoWeekYear"] = serialize_value(self.iso_week_year)
-            if self.iso_week is not None:
-                result["isoWeek"] = serialize_value(self.iso_week)
-            if self.iso_day_of_week is not None:
-                result["isoDayOfWeek"] = serialize_value(self.iso_day_of_week)
-        else:
-            result["year"] = serialize_value(self.year)
-            if self.month is not None:
-                result["month"] = serialize_value(self.month)
-            if self.day is not None:
-                result["day"] = serialize_value(self.day)
-
-    def _add_time_parts(self, result: dict[str, Any]) -> None:
-        """Add time part fields to result dict."""
-        if self.hour is not None:
-            result["hour"] = serialize_value(self.hour)
-        if self.minute is not None:
-            result["minute"] = serialize_value(self.minute)
-        if self.second is not None:
-            result["second"] = serialize_value(self.second)
-        if self.millisecond is not None:
-            result["millisecond"] = serialize_value(self.millisecond)
-        if self.timezone is not None:
-            result["timezone"] = self.timezone
-
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $dateFromParts expression."""
-        result: dict[str, Any] = {}
-        self._add_date_parts(result)
-        self._add_time_parts(result)
+        if self.iso_week_year is not None:
+            result = {"isoWeekYear": _sv(self.iso_week_year)}
+            optional = _ISO_WEEK_PARTS
+        else:
+            result = {"year": _sv(self.year)}
+            optional = _CALENDAR_PARTS
+        for key, name in optional:
+            value = getattr(self, name)
+            if value is not None:
+                result[key] = _sv(value)
         return {"$dateFromParts": result}
 
 
@@ -597,15 +390,9 @@ class DateToPartsExpr(ExpressionBase):
     timezone: str | None = None
     iso8601: bool | None = None
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $dateToParts expression."""
-        result: dict[str, Any] = {"date": serialize_value(self.date)}
-        if self.timezone is not None:
-            result["timezone"] = self.timezone
-        if self.iso8601 is not None:
-            result["iso8601"] = self.iso8601
-        return {"$dateToParts": result}
+    _op = "$dateToParts"
+    _layout = Layout.NAMED
+    _args = ("date", "timezone", "iso8601")
 
 
 class DateTruncExpr(ExpressionBase):
@@ -623,20 +410,15 @@ class DateTruncExpr(ExpressionBase):
     timezone: str | None = None
     start_of_week: str | None = None
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $dateTrunc expression."""
-        result: dict[str, Any] = {
-            "date": serialize_value(self.date),
-            "unit": self.unit,
-        }
-        if self.bin_size is not None:
-            result["binSize"] = self.bin_size
-        if self.timezone is not None:
-            result["timezone"] = self.timezone
-        if self.start_of_week is not None:
-            result["startOfWeek"] = self.start_of_week
-        return {"$dateTrunc": result}
+    _op = "$dateTrunc"
+    _layout = Layout.NAMED
+    _args = ("date", "unit", "bin_size", "timezone", "start_of_week")
+
+    @field_validator("unit", "timezone", "start_of_week")
+    @classmethod
+    def _intern(cls, value: str | None) -> str | None:
+        """Share one object per unit, timezone and weekday name."""
+        return None if value is None else sys.intern(value)
 
 
 __all__ = [
@@ -2,10 +2,7 @@
 
 from typing import Any
 
-from pydantic import model_serializer
-
-from mongo_aggro.base import serialize_value
-from mongo_aggro.expressions.base import ExpressionBase
+from mongo_aggro.expressions.base import ExpressionBase, Layout
 
 
 class EncStrContainsExpr(ExpressionBase):
@@ -22,15 +19,9 @@ class EncStrContainsExpr(ExpressionBase):
     input: Any
     substring: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $encStrContains expression."""
-        return {
-            "$encStrContains": {
-                "input": serialize_value(self.input),
-                "substring": serialize_value(self.substring),
-            }
-        }
+    _op = "$encStrContains"
+    _layout = Layout.NAMED
+    _args = ("input", "substring")
 
 
 class EncStrStartsWithExpr(ExpressionBase):
@@ -47,15 +38,9 @@ class EncStrStartsWithExpr(ExpressionBase):
     input: Any
     prefix: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $encStrStartsWith expression."""
-        return {
-            "$encStrStartsWith": {
-                "input": serialize_value(self.input),
-                "prefix": serialize_value(self.prefix),
-            }
-        }
+    _op = "$encStrStartsWith"
+    _layout = Layout.NAMED
+    _args = ("input", "prefix")
 
 
 class EncStrEndsWithExpr(ExpressionBase):
@@ -72,15 +57,9 @@ class EncStrEndsWithExpr(ExpressionBase):
     input: Any
     suffix: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $encStrEndsWith expression."""
-        return {
-            "$encStrEndsWith": {
-                "input": serialize_value(self.input),
-                "suffix": serialize_value(self.suffix),
-            }
-        }
+    _op = "$encStrEndsWith"
+    _layout = Layout.NAMED
+    _args = ("input", "suffix")
 
 
 class EncStrNormalizedEqExpr(ExpressionBase):
@@ -97,15 +76,9 @@ class EncStrNormalizedEqExpr(ExpressionBase):
     input: Any
     value: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $encStrNormalizedEq expression."""
-        return {
-            "$encStrNormalizedEq": {
-                "input": serialize_value(self.input),
-                "value": serialize_value(self.value),
-            }
-        }
+    _op = "$encStrNormalizedEq"
+    _layout = Layout.NAMED
+    _args = ("input", "value")
 
 
 __all__ = [
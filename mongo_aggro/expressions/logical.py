@@ -1,11 +1,53 @@
 """Logical expression operators for MongoDB aggregation."""
 
+from collections.abc import Callable
 from typing import Any
 
-from pydantic import model_serializer
+from pydantic import BaseModel, model_serializer
 
-from mongo_aggro.base import serialize_value
-from mongo_aggro.expressions.base import ExpressionBase
+from mongo_aggro.base import serialize_many, serialize_value
+from mongo_aggro.expressions.base import ExpressionBase, Field, Layout
+from mongo_aggro.expressions.comparison import (
+    EqExpr,
+    GteExpr,
+    GtExpr,
+    LteExpr,
+    LtExpr,
+    NeExpr,
+)
+
+# Comparison expressions that have a query-language equivalent
+_QUERY_OPERATORS: frozenset[type[ExpressionBase]] = frozenset(
+    {EqExpr, NeExpr, GtExpr, GteExpr, LtExpr, LteExpr}
+)
+
+
+def _query_field(condition: Any) -> tuple[str, str] | None:
+    """
+    Return (field name, operator) if condition fits query shorthand.
+
+    Only comparisons of a document field against a scalar literal
+    qualify. Variables ("$$var"), field-to-field comparisons, nested
+    expressions, lists, tuples and dicts (which $expr evaluates
+    element-wise), "$"-prefixed strings (which $expr reads as paths)
+    and None (which the query language also matches against missing
+    fields) do not.
+    """
+    if type(condition) not in _QUERY_OPERATORS or not isinstance(
+        condition.left, Field
+    ):
+        return None
+    path = str(condition.left)
+    right = condition.right
+    if (
+        right is None
+        or path.startswith("$$")
+        or isinstance(right, (Field, BaseModel, dict, list, tuple))
+    ):
+        return None
+    if isinstance(right, str) and right.startswith("$"):
+        return None
+    return path[1:], type(condition)._op
 
 
 class AndExpr(ExpressionBase):
@@ -20,12 +62,54 @@ class AndExpr(ExpressionBase):
         {"$and": [{"$eq": ["$a", 1]}, {"$gt": ["$b", 2]}]}
     """
 
-    conditions: list[Any]
+    conditions: tuple[Any, ...]
+
+    _is_and = True
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _many: Callable[[Any], list[Any]] = serialize_many
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $and expression."""
-        return {"$and": [serialize_value(c) for c in self.conditions]}
+        return {"$and": _many(self.conditions)}
+
+    def to_match_dict(self) -> dict[str, Any]:
+        """
+        Compile to a $match query, fusing comparisons on the same field.
+
+        Field-versus-literal comparisons are emitted in query shorthand,
+        grouped per field; everything else is kept under $expr. The
+        query operators use query semantics, which differ from $expr:
+        $lt/$lte under $expr match missing or null fields while the
+        query form does not, and query operators also match array
+        elements and only compare values of the same type.
+
+        Example:
+            >>> ((F("age") > 18) & (F("age") < 65)).to_match_dict()
+            {"age": {"$gt": 18, "$lt": 65}}
+
+            >>> ((F("a") == 1) & (F("b") > F("c"))).to_match_dict()
+            {"a": {"$eq": 1}, "$expr": {"$gt": ["$b", "$c"]}}
+        """
+        query: dict[str, Any] = {}
+        remaining: list[Any] = []
+        for condition in self.conditions:
+            target = _query_field(condition)
+            if target is None:
+                remaining.append(serialize_value(condition))
+                continue
+            field, operator = target
+            operators = query.setdefault(field, {})
+            if operator in operators:
+                # Repeated operator on one field cannot share a dict
+                remaining.append(serialize_value(condition))
+                continue
+            operators[operator] = serialize_value(condition.right)
+        if len(remaining) == 1:
+            query["$expr"] = remaining[0]
+        elif remaining:
+            query["$expr"] = {"$and": remaining}
+        return query
 
 
 class OrExpr(ExpressionBase):
@@ -40,12 +124,16 @@ class OrExpr(ExpressionBase):
         {"$or": [{"$eq": ["$a", 1]}, {"$eq": ["$a", 2]}]}
     """
 
-    conditions: list[Any]
+    conditions: tuple[Any, ...]
+
+    _is_or = True
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _many: Callable[[Any], list[Any]] = serialize_many
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $or expression."""
-        return {"$or": [serialize_value(c) for c in self.conditions]}
+        return {"$or": _many(self.conditions)}
 
 
 class NotExpr(ExpressionBase):
@@ -59,10 +147,9 @@ class NotExpr(ExpressionBase):
 
     condition: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $not expression."""
-        return {"$not": serialize_value(self.condition)}
+    _op = "$not"
+    _layout = Layout.SINGLE
+    _args = ("condition",)
 
 
 __all__ = [
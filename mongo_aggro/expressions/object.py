@@ -1,11 +1,12 @@
 """Object expression operators for MongoDB aggregation."""
 
+from collections.abc import Callable
 from typing import Any
 
 from pydantic import model_serializer
 
 from mongo_aggro.base import serialize_value
-from mongo_aggro.expressions.base import ExpressionBase
+from mongo_aggro.expressions.base import ExpressionBase, Layout
 
 
 class MergeObjectsExpr(ExpressionBase):
@@ -19,10 +20,9 @@ class MergeObjectsExpr(ExpressionBase):
 
     objects: list[Any]
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $mergeObjects expression."""
-        return {"$mergeObjects": [serialize_value(o) for o in self.objects]}
+    _op = "$mergeObjects"
+    _layout = Layout.LIST
+    _args = ("objects",)
 
 
 class ObjectToArrayExpr(ExpressionBase):
@@ -36,10 +36,9 @@ class ObjectToArrayExpr(ExpressionBase):
 
     input: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $objectToArray expression."""
-        return {"$objectToArray": serialize_value(self.input)}
+    _op = "$objectToArray"
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
 class ArrayToObjectExpr(ExpressionBase):
@@ -53,10 +52,9 @@ class ArrayToObjectExpr(ExpressionBase):
 
     input: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $arrayToObject expression."""
-        return {"$arrayToObject": serialize_value(self.input)}
+    _op = "$arrayToObject"
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
 class GetFieldExpr(ExpressionBase):
@@ -72,14 +70,16 @@ class GetFieldExpr(ExpressionBase):
     input: Any | None = None
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $getField expression."""
         if self.input is None:
-            return {"$getField": serialize_value(self.field)}
+            return {"$getField": _sv(self.field)}
         return {
             "$getField": {
-                "field": serialize_value(self.field),
-                "input": serialize_value(self.input),
+                "field": _sv(self.field),
+                "input": _sv(self.input),
             }
         }
 
@@ -101,16 +101,9 @@ class SetFieldExpr(ExpressionBase):
     input: Any
     value: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $setField expression."""
-        return {
-            "$setField": {
-                "field": serialize_value(self.field),
-                "input": serialize_value(self.input),
-                "value": serialize_value(self.value),
-            }
-        }
+    _op = "$setField"
+    _layout = Layout.NAMED
+    _args = ("field", "input", "value")
 
 
 __all__ = [
@@ -2,10 +2,7 @@
 
 from typing import Any
 
-from pydantic import model_serializer
-
-from mongo_aggro.base import serialize_value
-from mongo_aggro.expressions.base import ExpressionBase
+from mongo_aggro.expressions.base import ExpressionBase, Layout, _UnaryExpr
 
 
 class SetUnionExpr(ExpressionBase):
@@ -19,10 +16,9 @@ class SetUnionExpr(ExpressionBase):
 
     arrays: list[Any]
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $setUnion expression."""
-        return {"$setUnion": [serialize_value(a) for a in self.arrays]}
+    _op = "$setUnion"
+    _layout = Layout.LIST
+    _args = ("arrays",)
 
 
 class SetIntersectionExpr(ExpressionBase):
@@ -36,10 +32,9 @@ class SetIntersectionExpr(ExpressionBase):
 
     arrays: list[Any]
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $setIntersection expression."""
-        return {"$setIntersection": [serialize_value(a) for a in self.arrays]}
+    _op = "$setIntersection"
+    _layout = Layout.LIST
+    _args = ("arrays",)
 
 
 class SetDifferenceExpr(ExpressionBase):
@@ -54,15 +49,9 @@ class SetDifferenceExpr(ExpressionBase):
     first: Any
     second: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $setDifference expression."""
-        return {
-            "$setDifference": [
-                serialize_value(self.first),
-                serialize_value(self.second),
-            ]
-        }
+    _op = "$setDifference"
+    _layout = Layout.POSITIONAL
+    _args = ("first", "second")
 
 
 class SetEqualsExpr(ExpressionBase):
@@ -76,10 +65,9 @@ class SetEqualsExpr(ExpressionBase):
 
     arrays: list[Any]
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $setEquals expression."""
-        return {"$setEquals": [serialize_value(a) for a in self.arrays]}
+    _op = "$setEquals"
+    _layout = Layout.LIST
+    _args = ("arrays",)
 
 
 class SetIsSubsetExpr(ExpressionBase):
@@ -94,18 +82,12 @@ class SetIsSubsetExpr(ExpressionBase):
     first: Any
     second: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $setIsSubset expression."""
-        return {
-            "$setIsSubset": [
-                serialize_value(self.first),
-                serialize_value(self.second),
-            ]
-        }
+    _op = "$setIsSubset"
+    _layout = Layout.POSITIONAL
+    _args = ("first", "second")
 
 
-class AnyElementTrueExpr(ExpressionBase):
+class AnyElementTrueExpr(_UnaryExpr):
     """
     $anyElementTrue expression operator - true if any array element is truthy.
 
@@ -114,15 +96,10 @@ class AnyElementTrueExpr(ExpressionBase):
         {"$anyElementTrue": "$flags"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $anyElementTrue expression."""
-        return {"$anyElementTrue": serialize_value(self.input)}
+    _op = "$anyElementTrue"
 
 
-class AllElementsTrueExpr(ExpressionBase):
+class AllElementsTrueExpr(_UnaryExpr):
     """
     $allElementsTrue expression operator - true if all array elements truthy.
 
@@ -131,12 +108,7 @@ class AllElementsTrueExpr(ExpressionBase):
         {"$allElementsTrue": "$conditions"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $allElementsTrue expression."""
-        return {"$allElementsTrue": serialize_value(self.input)}
+    _op = "$allElementsTrue"
 
 
 __all__ = [
@@ -1,14 +1,9 @@
 """Data size expression operators for MongoDB aggregation."""
 
-from typing import Any
+from mongo_aggro.expressions.base import _UnaryExpr
 
-from pydantic import model_serializer
 
-from mongo_aggro.base import serialize_value
-from mongo_aggro.expressions.base import ExpressionBase
-
-
-class BsonSizeExpr(ExpressionBase):
+class BsonSizeExpr(_UnaryExpr):
     """
     $bsonSize expression operator - returns size of document in bytes.
 
@@ -17,15 +12,10 @@ class BsonSizeExpr(ExpressionBase):
         {"$bsonSize": "$doc"}
     """
 
-    input: Any
+    _op = "$bsonSize"
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $bsonSize expression."""
-        return {"$bsonSize": serialize_value(self.input)}
 
-
-class BinarySizeExpr(ExpressionBase):
+class BinarySizeExpr(_UnaryExpr):
     """
     $binarySize expression operator - returns size of string/binary in bytes.
 
@@ -34,12 +24,7 @@ class BinarySizeExpr(ExpressionBase):
         {"$binarySize": "$data"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $binarySize expression."""
-        return {"$binarySize": serialize_value(self.input)}
+    _op = "$binarySize"
 
 
 __all__ = [
@@ -2,10 +2,12 @@
 
 from typing import Any
 
-from pydantic import model_serializer
+from pydantic import field_validator
 
-from mongo_aggro.base import serialize_value
-from mongo_aggro.expressions.base import ExpressionBase
+from mongo_aggro.expressions.base import ExpressionBase, Layout
+
+# Option flags accepted by MongoDB's regular expression operators
+_REGEX_OPTIONS = frozenset("imsxu")
 
 
 class ConcatExpr(ExpressionBase):
@@ -19,10 +21,9 @@ class ConcatExpr(ExpressionBase):
 
     strings: list[Any]
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $concat expression."""
-        return {"$concat": [serialize_value(s) for s in self.strings]}
+    _op = "$concat"
+    _layout = Layout.LIST
+    _args = ("strings",)
 
 
 class SplitExpr(ExpressionBase):
@@ -37,10 +38,9 @@ class SplitExpr(ExpressionBase):
     input: Any
     delimiter: str
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $split expression."""
-        return {"$split": [serialize_value(self.input), self.delimiter]}
+    _op = "$split"
+    _layout = Layout.POSITIONAL
+    _args = ("input", "delimiter")
 
 
 class ToLowerExpr(ExpressionBase):
@@ -54,10 +54,9 @@ class ToLowerExpr(ExpressionBase):
 
     input: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $toLower expression."""
-        return {"$toLower": serialize_value(self.input)}
+    _op = "$toLower"
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
 class ToUpperExpr(ExpressionBase):
@@ -71,10 +70,9 @@ class ToUpperExpr(ExpressionBase):
 
     input: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $toUpper expression."""
-        return {"$toUpper": serialize_value(self.input)}
+    _op = "$toUpper"
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
 class TrimExpr(ExpressionBase):
@@ -89,15 +87,9 @@ class TrimExpr(ExpressionBase):
     input: Any
     chars: str | None = None
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $trim expression."""
-        result: dict[str, Any] = {
-            "$trim": {"input": serialize_value(self.input)}
-        }
-        if self.chars is not None:
-            result["$trim"]["chars"] = self.chars
-        return result
+    _op = "$trim"
+    _layout = Layout.NAMED
+    _args = ("input", "chars")
 
 
 class LTrimExpr(ExpressionBase):
@@ -112,15 +104,9 @@ class LTrimExpr(ExpressionBase):
     input: Any
     chars: str | None = None
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $ltrim expression."""
-        result: dict[str, Any] = {
-            "$ltrim": {"input": serialize_value(self.input)}
-        }
-        if self.chars is not None:
-            result["$ltrim"]["chars"] = self.chars
-        return result
+    _op = "$ltrim"
+    _layout = Layout.NAMED
+    _args = ("input", "chars")
 
 
 class RTrimExpr(ExpressionBase):
@@ -135,15 +121,9 @@ class RTrimExpr(ExpressionBase):
     input: Any
     chars: str | None = None
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $rtrim expression."""
-        result: dict[str, Any] = {
-            "$rtrim": {"input": serialize_value(self.input)}
-        }
-        if self.chars is not None:
-            result["$rtrim"]["chars"] = self.chars
-        return result
+    _op = "$rtrim"
+    _layout = Layout.NAMED
+    _args = ("input", "chars")
 
 
 class ReplaceOneExpr(ExpressionBase):
@@ -163,16 +143,9 @@ class ReplaceOneExpr(ExpressionBase):
     find: Any
     replacement: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $replaceOne expression."""
-        return {
-            "$replaceOne": {
-                "input": serialize_value(self.input),
-                "find": serialize_value(self.find),
-                "replacement": serialize_value(self.replacement),
-            }
-        }
+    _op = "$replaceOne"
+    _layout = Layout.NAMED
+    _args = ("input", "find", "replacement")
 
 
 class ReplaceAllExpr(ExpressionBase):
@@ -192,46 +165,51 @@ class ReplaceAllExpr(ExpressionBase):
     find: Any
     replacement: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $replaceAll expression."""
-        return {
-            "$replaceAll": {
-                "input": serialize_value(self.input),
-                "find": serialize_value(self.find),
-                "replacement": serialize_value(self.replacement),
-            }
-        }
+    _op = "$replaceAll"
+    _layout = Layout.NAMED
+    _args = ("input", "find", "replacement")
 
 
-class RegexMatchExpr(ExpressionBase):
+class _RegexExpr(ExpressionBase):
     """
-    $regexMatch expression operator - tests if string matches regex.
+    Shared fields of the $regexMatch/$regexFind/$regexFindAll operators.
 
-    Example:
-        >>> RegexMatchExpr(input=F("email"), regex=r"@.*\\.com$").model_dump()
-        {"$regexMatch": {"input": "$email", "regex": "@.*\\\\.com$"}}
+    Options are checked at construction so a typo fails locally rather
+    than on the server. The pattern itself is passed through untouched:
+    MongoDB uses PCRE syntax, which Python's re module does not fully
+    accept, and it may also be an expression such as a field path.
     """
 
     input: Any
     regex: str
     options: str | None = None
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $regexMatch expression."""
-        result: dict[str, Any] = {
-            "$regexMatch": {
-                "input": serialize_value(self.input),
-                "regex": self.regex,
-            }
-        }
-        if self.options is not None:
-            result["$regexMatch"]["options"] = self.options
-        return result
+    _layout = Layout.NAMED
+    _args = ("input", "regex", "options")
+
+    @field_validator("options")
+    @classmethod
+    def _check_options(cls, options: str | None) -> str | None:
+        """Reject option flags MongoDB does not support."""
+        if options is not None and not _REGEX_OPTIONS.issuperset(options):
+            unknown = "".join(sorted(set(options) - _REGEX_OPTIONS))
+            raise ValueError(f"unsupported regex options: {unknown!r}")
+        return options
+
+
+class RegexMatchExpr(_RegexExpr):
+    """
+    $regexMatch expression operator - tests if string matches regex.
+
+    Example:
+        >>> RegexMatchExpr(input=F("email"), regex=r"@.*\\.com$").model_dump()
+        {"$regexMatch": {"input": "$email", "regex": "@.*\\\\.com$"}}
+    """
+
+    _op = "$regexMatch"
 
 
-class RegexFindExpr(ExpressionBase):
+class RegexFindExpr(_RegexExpr):
     """
     $regexFind expression operator - finds first regex match.
 
@@ -240,25 +218,10 @@ class RegexFindExpr(ExpressionBase):
         {"$regexFind": {"input": "$text", "regex": "\\\\d+"}}
     """
 
-    input: Any
-    regex: str
-    options: str | None = None
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $regexFind expression."""
-        result: dict[str, Any] = {
-            "$regexFind": {
-                "input": serialize_value(self.input),
-                "regex": self.regex,
-            }
-        }
-        if self.options is not None:
-            result["$regexFind"]["options"] = self.options
-        return result
+    _op = "$regexFind"
 
 
-class RegexFindAllExpr(ExpressionBase):
+class RegexFindAllExpr(_RegexExpr):
     """
     $regexFindAll expression operator - finds all regex matches.
 
@@ -267,22 +230,7 @@ class RegexFindAllExpr(ExpressionBase):
         {"$regexFindAll": {"input": "$text", "regex": "\\\\w+"}}
     """
 
-    input: Any
-    regex: str
-    options: str | None = None
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $regexFindAll expression."""
-        result: dict[str, Any] = {
-            "$regexFindAll": {
-                "input": serialize_value(self.input),
-                "regex": self.regex,
-            }
-        }
-        if self.options is not None:
-            result["$regexFindAll"]["options"] = self.options
-        return result
+    _op = "$regexFindAll"
 
 
 class SubstrCPExpr(ExpressionBase):
@@ -298,12 +246,9 @@ class SubstrCPExpr(ExpressionBase):
     start: int
     length: int
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $substrCP expression."""
-        return {
-            "$substrCP": [serialize_value(self.input), self.start, self.length]
-        }
+    _op = "$substrCP"
+    _layout = Layout.POSITIONAL
+    _args = ("input", "start", "length")
 
 
 class StrLenCPExpr(ExpressionBase):
@@ -317,10 +262,9 @@ class StrLenCPExpr(ExpressionBase):
 
     input: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $strLenCP expression."""
-        return {"$strLenCP": serialize_value(self.input)}
+    _op = "$strLenCP"
+    _layout = Layout.SINGLE
+    _args = ("input",)
 
 
 class StrCaseCmpExpr(ExpressionBase):
@@ -335,15 +279,9 @@ class StrCaseCmpExpr(ExpressionBase):
     first: Any
     second: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $strcasecmp expression."""
-        return {
-            "$strcasecmp": [
-                serialize_value(self.first),
-                serialize_value(self.second),
-            ]
-        }
+    _op = "$strcasecmp"
+    _layout = Layout.POSITIONAL
+    _args = ("first", "second")
 
 
 __all__ = [
@@ -2,13 +2,10 @@
 
 from typing import Any
 
-from pydantic import model_serializer
+from mongo_aggro.expressions.base import ExpressionBase, Layout, _UnaryExpr
 
-from mongo_aggro.base import serialize_value
-from mongo_aggro.expressions.base import ExpressionBase
 
-
-class SinExpr(ExpressionBase):
+class SinExpr(_UnaryExpr):
     """
     $sin expression operator - calculates sine.
 
@@ -17,15 +14,10 @@ class SinExpr(ExpressionBase):
         {"$sin": "$angle"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $sin expression."""
-        return {"$sin": serialize_value(self.input)}
+    _op = "$sin"
 
 
-class CosExpr(ExpressionBase):
+class CosExpr(_UnaryExpr):
     """
     $cos expression operator - calculates cosine.
 
@@ -34,15 +26,10 @@ class CosExpr(ExpressionBase):
         {"$cos": "$angle"}
     """
 
-    input: Any
+    _op = "$cos"
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $cos expression."""
-        return {"$cos": serialize_value(self.input)}
 
-
-class TanExpr(ExpressionBase):
+class TanExpr(_UnaryExpr):
     """
     $tan expression operator - calculates tangent.
 
@@ -51,15 +38,10 @@ class TanExpr(ExpressionBase):
         {"$tan": "$angle"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $tan expression."""
-        return {"$tan": serialize_value(self.input)}
+    _op = "$tan"
 
 
-class AsinExpr(ExpressionBase):
+class AsinExpr(_UnaryExpr):
     """
     $asin expression operator - calculates arc sine.
 
@@ -68,15 +50,10 @@ class AsinExpr(ExpressionBase):
         {"$asin": "$value"}
     """
 
-    input: Any
+    _op = "$asin"
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $asin expression."""
-        return {"$asin": serialize_value(self.input)}
 
-
-class AcosExpr(ExpressionBase):
+class AcosExpr(_UnaryExpr):
     """
     $acos expression operator - calculates arc cosine.
 
@@ -85,15 +62,10 @@ class AcosExpr(ExpressionBase):
         {"$acos": "$value"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $acos expression."""
-        return {"$acos": serialize_value(self.input)}
+    _op = "$acos"
 
 
-class AtanExpr(ExpressionBase):
+class AtanExpr(_UnaryExpr):
     """
     $atan expression operator - calculates arc tangent.
 
@@ -102,12 +74,7 @@ class AtanExpr(ExpressionBase):
         {"$atan": "$value"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $atan expression."""
-        return {"$atan": serialize_value(self.input)}
+    _op = "$atan"
 
 
 class Atan2Expr(ExpressionBase):
@@ -122,13 +89,12 @@ class Atan2Expr(ExpressionBase):
     y: Any
     x: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $atan2 expression."""
-        return {"$atan2": [serialize_value(self.y), serialize_value(self.x)]}
+    _op = "$atan2"
+    _layout = Layout.POSITIONAL
+    _args = ("y", "x")
 
 
-class SinhExpr(ExpressionBase):
+class SinhExpr(_UnaryExpr):
     """
     $sinh expression operator - calculates hyperbolic sine.
 
@@ -137,15 +103,10 @@ class SinhExpr(ExpressionBase):
         {"$sinh": "$value"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $sinh expression."""
-        return {"$sinh": serialize_value(self.input)}
+    _op = "$sinh"
 
 
-class CoshExpr(ExpressionBase):
+class CoshExpr(_UnaryExpr):
     """
     $cosh expression operator - calculates hyperbolic cosine.
 
@@ -154,15 +115,10 @@ class CoshExpr(ExpressionBase):
         {"$cosh": "$value"}
     """
 
-    input: Any
+    _op = "$cosh"
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $cosh expression."""
-        return {"$cosh": serialize_value(self.input)}
 
-
-class TanhExpr(ExpressionBase):
+class TanhExpr(_UnaryExpr):
     """
     $tanh expression operator - calculates hyperbolic tangent.
 
@@ -171,15 +127,10 @@ class TanhExpr(ExpressionBase):
         {"$tanh": "$value"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $tanh expression."""
-        return {"$tanh": serialize_value(self.input)}
+    _op = "$tanh"
 
 
-class AsinhExpr(ExpressionBase):
+class AsinhExpr(_UnaryExpr):
     """
     $asinh expression operator - calculates hyperbolic arc sine.
 
@@ -188,15 +139,10 @@ class AsinhExpr(ExpressionBase):
         {"$asinh": "$value"}
     """
 
-    input: Any
+    _op = "$asinh"
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $asinh expression."""
-        return {"$asinh": serialize_value(self.input)}
 
-
-class AcoshExpr(ExpressionBase):
+class AcoshExpr(_UnaryExpr):
     """
     $acosh expression operator - calculates hyperbolic arc cosine.
 
@@ -205,15 +151,10 @@ class AcoshExpr(ExpressionBase):
         {"$acosh": "$value"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $acosh expression."""
-        return {"$acosh": serialize_value(self.input)}
+    _op = "$acosh"
 
 
-class AtanhExpr(ExpressionBase):
+class AtanhExpr(_UnaryExpr):
     """
     $atanh expression operator - calculates hyperbolic arc tangent.
 
@@ -222,15 +163,10 @@ class AtanhExpr(ExpressionBase):
         {"$atanh": "$value"}
     """
 
-    input: Any
+    _op = "$atanh"
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $atanh expression."""
-        return {"$atanh": serialize_value(self.input)}
 
-
-class DegreesToRadiansExpr(ExpressionBase):
+class DegreesToRadiansExpr(_UnaryExpr):
     """
     $degreesToRadians expression operator - converts degrees to radians.
 
@@ -239,15 +175,10 @@ class DegreesToRadiansExpr(ExpressionBase):
         {"$degreesToRadians": "$degrees"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $degreesToRadians expression."""
-        return {"$degreesToRadians": serialize_value(self.input)}
+    _op = "$degreesToRadians"
 
 
-class RadiansToDegreesExpr(ExpressionBase):
+class RadiansToDegreesExpr(_UnaryExpr):
     """
     $radiansToDegrees expression operator - converts radians to degrees.
 
@@ -256,12 +187,7 @@ class RadiansToDegreesExpr(ExpressionBase):
         {"$radiansToDegrees": "$radians"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $radiansToDegrees expression."""
-        return {"$radiansToDegrees": serialize_value(self.input)}
+    _op = "$radiansToDegrees"
 
 
 __all__ = [
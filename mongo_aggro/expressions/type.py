@@ -2,13 +2,10 @@
 
 from typing import Any
 
-from pydantic import model_serializer
+from mongo_aggro.expressions.base import ExpressionBase, Layout, _UnaryExpr
 
-from mongo_aggro.base import serialize_value
-from mongo_aggro.expressions.base import ExpressionBase
 
-
-class ToStringExpr(ExpressionBase):
+class ToStringExpr(_UnaryExpr):
     """
     $toString expression operator - converts value to string.
 
@@ -17,15 +14,10 @@ class ToStringExpr(ExpressionBase):
         {"$toString": "$numericId"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $toString expression."""
-        return {"$toString": serialize_value(self.input)}
+    _op = "$toString"
 
 
-class ToIntExpr(ExpressionBase):
+class ToIntExpr(_UnaryExpr):
     """
     $toInt expression operator - converts value to integer.
 
@@ -34,15 +26,10 @@ class ToIntExpr(ExpressionBase):
         {"$toInt": "$stringNum"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $toInt expression."""
-        return {"$toInt": serialize_value(self.input)}
+    _op = "$toInt"
 
 
-class ToDoubleExpr(ExpressionBase):
+class ToDoubleExpr(_UnaryExpr):
     """
     $toDouble expression operator - converts value to double.
 
@@ -51,15 +38,10 @@ class ToDoubleExpr(ExpressionBase):
         {"$toDouble": "$intValue"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $toDouble expression."""
-        return {"$toDouble": serialize_value(self.input)}
+    _op = "$toDouble"
 
 
-class ToBoolExpr(ExpressionBase):
+class ToBoolExpr(_UnaryExpr):
     """
     $toBool expression operator - converts value to boolean.
 
@@ -68,15 +50,10 @@ class ToBoolExpr(ExpressionBase):
         {"$toBool": "$flag"}
     """
 
-    input: Any
+    _op = "$toBool"
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $toBool expression."""
-        return {"$toBool": serialize_value(self.input)}
 
-
-class ToObjectIdExpr(ExpressionBase):
+class ToObjectIdExpr(_UnaryExpr):
     """
     $toObjectId expression operator - converts value to ObjectId.
 
@@ -85,15 +62,10 @@ class ToObjectIdExpr(ExpressionBase):
         {"$toObjectId": "$idString"}
     """
 
-    input: Any
+    _op = "$toObjectId"
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $toObjectId expression."""
-        return {"$toObjectId": serialize_value(self.input)}
 
-
-class ToLongExpr(ExpressionBase):
+class ToLongExpr(_UnaryExpr):
     """
     $toLong expression operator - converts value to long integer.
 
@@ -102,15 +74,10 @@ class ToLongExpr(ExpressionBase):
         {"$toLong": "$value"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $toLong expression."""
-        return {"$toLong": serialize_value(self.input)}
+    _op = "$toLong"
 
 
-class ToDecimalExpr(ExpressionBase):
+class ToDecimalExpr(_UnaryExpr):
     """
     $toDecimal expression operator - converts value to Decimal128.
 
@@ -119,12 +86,7 @@ class ToDecimalExpr(ExpressionBase):
         {"$toDecimal": "$value"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $toDecimal expression."""
-        return {"$toDecimal": serialize_value(self.input)}
+    _op = "$toDecimal"
 
 
 class ConvertExpr(ExpressionBase):
@@ -141,23 +103,12 @@ class ConvertExpr(ExpressionBase):
     on_error: Any = None
     on_null: Any = None
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $convert expression."""
-        result: dict[str, Any] = {
-            "$convert": {
-                "input": serialize_value(self.input),
-                "to": self.to,
-            }
-        }
-        if self.on_error is not None:
-            result["$convert"]["onError"] = serialize_value(self.on_error)
-        if self.on_null is not None:
-            result["$convert"]["onNull"] = serialize_value(self.on_null)
-        return result
+    _op = "$convert"
+    _layout = Layout.NAMED
+    _args = ("input", "to", "on_error", "on_null")
 
 
-class TypeExpr(ExpressionBase):
+class TypeExpr(_UnaryExpr):
     """
     $type expression operator - returns BSON type of a value.
 
@@ -166,15 +117,10 @@ class TypeExpr(ExpressionBase):
         {"$type": "$field"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $type expression."""
-        return {"$type": serialize_value(self.input)}
+    _op = "$type"
 
 
-class IsNumberExpr(ExpressionBase):
+class IsNumberExpr(_UnaryExpr):
     """
     $isNumber expression operator - checks if value is numeric.
 
@@ -183,12 +129,7 @@ class IsNumberExpr(ExpressionBase):
         {"$isNumber": "$value"}
     """
 
-    input: Any
-
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $isNumber expression."""
-        return {"$isNumber": serialize_value(self.input)}
+    _op = "$isNumber"
 
 
 __all__ = [
@@ -1,11 +1,11 @@
 """Variable expression operators for MongoDB aggregation."""
 
+from functools import lru_cache
 from typing import Any
 
 from pydantic import model_serializer
 
-from mongo_aggro.base import serialize_value
-from mongo_aggro.expressions.base import ExpressionBase
+from mongo_aggro.expressions.base import ExpressionBase, Layout
 
 
 class LetExpr(ExpressionBase):
@@ -23,15 +23,9 @@ class LetExpr(ExpressionBase):
     vars: dict[str, Any]
     in_: Any
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $let expression."""
-        return {
-            "$let": {
-                "vars": {k: serialize_value(v) for k, v in self.vars.items()},
-                "in": serialize_value(self.in_),
-            }
-        }
+    _op = "$let"
+    _layout = Layout.NAMED
+    _args = ("vars", "in_")
 
 
 class LiteralExpr(ExpressionBase):
@@ -51,23 +45,60 @@ class LiteralExpr(ExpressionBase):
         return {"$literal": self.value}
 
 
+# Floats are left out: 0.0 and -0.0 compare equal and NaN never does, so
+# a value-keyed cache would mix up signed zeros and fill up with NaNs
+_SHARED_TYPES: frozenset[type] = frozenset({str, int, bool, type(None)})
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _shared_literal(value: Any) -> LiteralExpr:
+    """Build the shared LiteralExpr for a scalar value."""
+    return LiteralExpr(value=value)
+
+
+def literal(value: Any) -> LiteralExpr:
+    """
+    Return a $literal expression, reusing instances for scalar values.
+
+    Expressions are immutable, so the same LiteralExpr can appear in
+    any number of pipelines. Scalars (str, int, bool, None) are served
+    from a bounded cache keyed by value and type; floats and containers
+    get a new instance.
+
+    Example:
+        >>> literal("$price") is literal("$price")
+        True
+    """
+    if type(value) in _SHARED_TYPES:
+        return _shared_literal(value)
+    return LiteralExpr(value=value)
+
+
 class RandExpr(ExpressionBase):
     """
     $rand expression operator - returns random float between 0 and 1.
 
+    The operator takes no arguments, so every instance is equivalent;
+    reuse the module-level ``RAND`` instance instead of constructing a
+    new one in hot paths.
+
     Example:
         >>> RandExpr().model_dump()
         {"$rand": {}}
     """
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $rand expression."""
-        return {"$rand": {}}
+    _op = "$rand"
+    _layout = Layout.NAMED
+    _args = ()
+
+
+RAND = RandExpr()
 
 
 __all__ = [
     "LetExpr",
     "LiteralExpr",
     "RandExpr",
+    "RAND",
+    "literal",
 ]
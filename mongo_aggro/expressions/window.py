@@ -1,11 +1,12 @@
 """Window expression operators for MongoDB aggregation."""
 
+from collections.abc import Callable
 from typing import Any
 
 from pydantic import model_serializer
 
 from mongo_aggro.base import serialize_value
-from mongo_aggro.expressions.base import ExpressionBase
+from mongo_aggro.expressions.base import ExpressionBase, Layout
 
 
 class RankExpr(ExpressionBase):
@@ -67,14 +68,16 @@ class ShiftExpr(ExpressionBase):
     default: Any = None
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $shift expression."""
         result: dict[str, Any] = {
-            "output": serialize_value(self.output),
+            "output": _sv(self.output),
             "by": self.by,
         }
         if self.default is not None:
-            result["default"] = serialize_value(self.default)
+            result["default"] = _sv(self.default)
         return {"$shift": result}
 
 
@@ -92,9 +95,11 @@ class ExpMovingAvgExpr(ExpressionBase):
     alpha: float | None = None
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $expMovingAvg expression."""
-        result: dict[str, Any] = {"input": serialize_value(self.input)}
+        result: dict[str, Any] = {"input": _sv(self.input)}
         if self.n is not None:
             result["N"] = self.n
         elif self.alpha is not None:
@@ -115,9 +120,11 @@ class DerivativeExpr(ExpressionBase):
     unit: str | None = None
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $derivative expression."""
-        result: dict[str, Any] = {"input": serialize_value(self.input)}
+        result: dict[str, Any] = {"input": _sv(self.input)}
         if self.unit is not None:
             result["unit"] = self.unit
         return {"$derivative": result}
@@ -136,9 +143,11 @@ class IntegralExpr(ExpressionBase):
     unit: str | None = None
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $integral expression."""
-        result: dict[str, Any] = {"input": serialize_value(self.input)}
+        result: dict[str, Any] = {"input": _sv(self.input)}
         if self.unit is not None:
             result["unit"] = self.unit
         return {"$integral": result}
@@ -155,10 +164,9 @@ class CovariancePopExpr(ExpressionBase):
 
     array: list[Any]
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $covariancePop expression."""
-        return {"$covariancePop": [serialize_value(a) for a in self.array]}
+    _op = "$covariancePop"
+    _layout = Layout.LIST
+    _args = ("array",)
 
 
 class CovarianceSampExpr(ExpressionBase):
@@ -172,10 +180,9 @@ class CovarianceSampExpr(ExpressionBase):
 
     array: list[Any]
 
-    @model_serializer
-    def serialize(self) -> dict[str, Any]:
-        """Serialize to MongoDB $covarianceSamp expression."""
-        return {"$covarianceSamp": [serialize_value(a) for a in self.array]}
+    _op = "$covarianceSamp"
+    _layout = Layout.LIST
+    _args = ("array",)
 
 
 class LinearFillExpr(ExpressionBase):
@@ -190,9 +197,11 @@ class LinearFillExpr(ExpressionBase):
     input: Any
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $linearFill expression."""
-        return {"$linearFill": serialize_value(self.input)}
+        return {"$linearFill": _sv(self.input)}
 
 
 class LocfExpr(ExpressionBase):
@@ -207,9 +216,11 @@ class LocfExpr(ExpressionBase):
     input: Any
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $locf expression."""
-        return {"$locf": serialize_value(self.input)}
+        return {"$locf": _sv(self.input)}
 
 
 class TopExpr(ExpressionBase):
@@ -225,12 +236,14 @@ class TopExpr(ExpressionBase):
     output: Any
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $top expression."""
         return {
             "$top": {
                 "sortBy": self.sort_by,
-                "output": serialize_value(self.output),
+                "output": _sv(self.output),
             }
         }
 
@@ -248,12 +261,14 @@ class BottomExpr(ExpressionBase):
     output: Any
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $bottom expression."""
         return {
             "$bottom": {
                 "sortBy": self.sort_by,
-                "output": serialize_value(self.output),
+                "output": _sv(self.output),
             }
         }
 
@@ -272,13 +287,15 @@ class TopNWindowExpr(ExpressionBase):
     output: Any
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $topN expression."""
         return {
             "$topN": {
-                "n": serialize_value(self.n),
+                "n": _sv(self.n),
                 "sortBy": self.sort_by,
-                "output": serialize_value(self.output),
+                "output": _sv(self.output),
             }
         }
 
@@ -297,13 +314,15 @@ class BottomNWindowExpr(ExpressionBase):
     output: Any
 
     @model_serializer
-    def serialize(self) -> dict[str, Any]:
+    def serialize(
+        self, *, _sv: Callable[[Any], Any] = serialize_value
+    ) -> dict[str, Any]:
         """Serialize to MongoDB $bottomN expression."""
         return {
             "$bottomN": {
-                "n": serialize_value(self.n),
+                "n": _sv(self.n),
                 "sortBy": self.sort_by,
-                "output": serialize_value(self.output),
+                "output": _sv(self.output),
             }
         }
 
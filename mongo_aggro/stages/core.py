@@ -8,6 +8,8 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from mongo_aggro.base import serialize_value
+
 
 class Match(BaseModel):
     """
@@ -25,6 +27,35 @@ class Match(BaseModel):
 
     query: dict[str, Any] = Field(..., description="Query filter conditions")
 
+    @classmethod
+    def from_expr(cls, expression: Any, *, fuse: bool = False) -> "Match":
+        """
+        Build a Match stage from an aggregation expression.
+
+        By default the expression is wrapped in $expr, keeping aggregation
+        semantics. With fuse=True, AND-combined comparisons against
+        literals are fused into query shorthand per field (see
+        AndExpr.to_match_dict) and the rest is wrapped in $expr. The
+        fused form uses query semantics and can select different
+        documents: $lt/$lte under $expr match missing or null fields
+        while the query operators do not, and query operators also match
+        array elements and only compare values of the same type.
+
+        Example:
+            >>> Match.from_expr(F("age") < 65)
+            Match(query={"$expr": {"$lt": ["$age", 65]}})
+
+            >>> Match.from_expr((F("age") > 18) & (F("age") < 65), fuse=True)
+            Match(query={"age": {"$gt": 18, "$lt": 65}})
+        """
+        if not fuse:
+            return cls(query={"$expr": serialize_value(expression)})
+        from mongo_aggro.expressions.logical import AndExpr
+
+        if not isinstance(expression, AndExpr):
+            expression = AndExpr(conditions=[expression])
+        return cls(query=expression.to_match_dict())
+
     def model_dump(self, **kwargs: Any) -> dict[str, Any]:
         return {"$match": self.query}
 
@@ -52,6 +52,13 @@ def test_add_expr_with_constants() -> None:
     assert expr.model_dump() == {"$add": [1, 2, 3]}
 
 
+def test_add_expr_operands_stored_as_tuple() -> None:
+    """AddExpr keeps list operands as a tuple."""
+    expr = AddExpr(operands=[F("a"), 1])
+    assert expr.operands == (F("a"), 1)
+    assert expr.model_dump() == {"$add": ["$a", 1]}
+
+
 def test_add_expr_missing_operands_raises() -> None:
     """AddExpr requires operands list."""
     with pytest.raises(ValidationError):
@@ -0,0 +1,326 @@
+"""Tests for the spec-driven ExpressionBase serializer.
+
+This module tests:
+- Each Layout (SINGLE, LIST, POSITIONAL, NAMED)
+- Output key derivation for NAMED layouts
+- Omission of unset optional arguments
+- Spec inheritance in subclasses
+- Per-class generated serializers
+- Independence of serialized output from the expression
+"""
+
+import sys
+from typing import Any
+
+import pytest
+from pydantic import ValidationError, model_serializer
+
+from mongo_aggro import serialize_value
+from mongo_aggro.expressions import (
+    AnyElementTrueExpr,
+    BsonSizeExpr,
+    F,
+    Layout,
+    SinExpr,
+    ToStringExpr,
+)
+from mongo_aggro.expressions.base import ExpressionBase, _UnaryExpr
+
+
+class UnaryOp(ExpressionBase):
+    """Test operator with a single argument."""
+
+    input: Any
+
+    _op = "$unary"
+    _layout = Layout.SINGLE
+    _args = ("input",)
+
+
+class VariadicOp(ExpressionBase):
+    """Test operator with a list argument."""
+
+    items: list[Any]
+
+    _op = "$variadic"
+    _layout = Layout.LIST
+    _args = ("items",)
+
+
+class PairOp(ExpressionBase):
+    """Test operator with positional arguments."""
+
+    first: Any
+    middle: Any = None
+    last: Any
+
+    _op = "$pair"
+    _layout = Layout.POSITIONAL
+    _args = ("first", "middle", "last")
+
+
+class NamedOp(ExpressionBase):
+    """Test operator with named arguments."""
+
+    input: Any
+    in_: Any
+    initial_value: Any = None
+
+    _op = "$named"
+    _layout = Layout.NAMED
+    _args = ("input", "in_", "initial_value")
+
+
+class SubNamedOp(NamedOp):
+    """Test operator inheriting the spec of its parent."""
+
+    _op = "$subNamed"
+
+
+# --- Layout Tests ---
+
+
+def test_single_layout() -> None:
+    """SINGLE layout emits the serialized argument directly."""
+    assert UnaryOp(input=F("x")).model_dump() == {"$unary": "$x"}
+
+
+def test_list_layout() -> None:
+    """LIST layout serializes each item of the list field."""
+    expr = VariadicOp(items=[F("a"), 1, UnaryOp(input=F("b"))])
+    assert expr.model_dump() == {"$variadic": ["$a", 1, {"$unary": "$b"}]}
+
+
+def test_positional_layout_skips_unset_optional() -> None:
+    """POSITIONAL layout drops optional arguments left as None."""
+    assert PairOp(first=F("a"), last=2).model_dump() == {"$pair": ["$a", 2]}
+    assert PairOp(first=F("a"), middle=1, last=2).model_dump() == {
+        "$pair": ["$a", 1, 2]
+    }
+
+
+def test_positional_layout_keeps_required_none() -> None:
+    """POSITIONAL layout keeps None passed to a required argument."""
+    assert PairOp(first=None, last=None).model_dump() == {
+        "$pair": [None, None]
+    }
+
+
+def test_named_layout_keys() -> None:
+    """NAMED layout derives camelCase keys and strips trailing underscore."""
+    expr = NamedOp(input=F("a"), in_=F("$$this"), initial_value=0)
+    assert expr.model_dump() == {
+        "$named": {"input": "$a", "in": "$$this", "initialValue": 0}
+    }
+
+
+def test_named_layout_skips_unset_optional() -> None:
+    """NAMED layout drops optional arguments left as None."""
+    expr = NamedOp(input=F("a"), in_=1)
+    assert expr.model_dump() == {"$named": {"input": "$a", "in": 1}}
+
+
+def test_subclass_inherits_spec() -> None:
+    """Subclasses reuse the inherited arguments and optional set."""
+    expr = SubNamedOp(input=F("a"), in_=1)
+    assert expr.model_dump() == {"$subNamed": {"input": "$a", "in": 1}}
+
+
+def test_unary_operators_share_one_base() -> None:
+    """Single-input operators across modules derive from _UnaryExpr."""
+    for cls in (SinExpr, ToStringExpr, BsonSizeExpr, AnyElementTrueExpr):
+        assert issubclass(cls, _UnaryExpr)
+        assert cls(input=F("x")).model_dump() == {cls._op: "$x"}
+
+
+# --- Generated Serializer Tests ---
+
+
+def test_serializer_generated_per_class() -> None:
+    """Each spec class gets its own compiled serialize()."""
+    assert UnaryOp.serialize is not VariadicOp.serialize
+    assert UnaryOp.serialize.__qualname__ == "UnaryOp.serialize"
+    assert UnaryOp(input=1).serialize() == {"$unary": 1}
+
+
+def test_hand_written_serializer_preserved() -> None:
+    """A subclass defining serialize() keeps its own implementation."""
+
+    class CustomOp(UnaryOp):
+        _op = "$custom"
+
+        @model_serializer
+        def serialize(self) -> dict[str, Any]:
+            return {"$custom": "fixed"}
+
+    class ChildOp(CustomOp):
+        _op = "$child"
+
+    assert CustomOp(input=1).model_dump() == {"$custom": "fixed"}
+    assert ChildOp(input=1).model_dump() == {"$custom": "fixed"}
+
+
+def test_subclass_model_post_init_runs() -> None:
+    """A spec subclass keeps its own model_post_init hook."""
+    seen: list[Any] = []
+
+    class TrackedOp(UnaryOp):
+        def model_post_init(self, context: Any, /) -> None:
+            seen.append(self.input)
+
+    assert TrackedOp(input=1).model_dump() == {"$unary": 1}
+    assert seen == [1]
+
+
+def test_custom_named_serializer_without_spec() -> None:
+    """A subclass may register its model serializer under any name."""
+
+    class ToMongoOp(ExpressionBase):
+        input: Any
+
+        @model_serializer
+        def to_mongo(self) -> dict[str, Any]:
+            return {"$custom": self.input}
+
+    assert ToMongoOp(input=1).model_dump() == {"$custom": 1}
+    assert not hasattr(ToMongoOp, "serialize")
+
+
+def test_custom_named_serializer_overrides_spec() -> None:
+    """A spec subclass with its own model serializer keeps using it."""
+
+    class RenamedOp(UnaryOp):
+        @model_serializer
+        def to_mongo(self) -> dict[str, Any]:
+            return {"$renamed": self.input}
+
+    assert RenamedOp(input=1).model_dump() == {"$renamed": 1}
+    assert "serialize" not in RenamedOp.__dict__
+
+
+def test_base_without_serializer_dumps_fields() -> None:
+    """ExpressionBase itself falls back to pydantic's field dump."""
+    assert ExpressionBase().model_dump() == {}
+
+
+def test_generated_keys_are_interned() -> None:
+    """Operator names and keys in generated output are interned."""
+    result = NamedOp(input=1, in_=2).serialize()
+    assert next(iter(result)) is sys.intern("$named")
+    assert next(iter(result["$named"])) is sys.intern("input")
+
+
+def test_hand_written_keys_are_interned() -> None:
+    """String constants in hand-written serializers are interned."""
+
+    class NestedOp(ExpressionBase):
+        input: Any
+
+        @model_serializer
+        def serialize(self) -> dict[str, Any]:
+            return {"$nested": {"startDate": self.input}}
+
+    result = NestedOp(input=1).serialize()
+    assert next(iter(result)) is sys.intern("$nested")
+    assert next(iter(result["$nested"])) is sys.intern("startDate")
+
+
+def test_generated_serializer_binds_helpers_locally() -> None:
+    """Generated code reads helpers as locals, not module globals."""
+    for cls in (UnaryOp, VariadicOp, PairOp, NamedOp):
+        names = cls.serialize.__code__.co_names
+        assert "serialize_value" not in names
+        assert "map" not in names
+        assert "type" not in names
+
+
+# --- Immutability Tests ---
+
+
+def test_expression_is_frozen() -> None:
+    """Assigning to an expression field raises."""
+    expr = UnaryOp(input=F("x"))
+    with pytest.raises(ValidationError):
+        expr.input = F("y")  # type: ignore[misc]
+
+
+def test_expression_with_scalar_fields_is_hashable() -> None:
+    """Frozen expressions with hashable fields can be hashed."""
+    assert hash(UnaryOp(input=F("x"))) == hash(UnaryOp(input=F("x")))
+
+
+# --- Output Independence Tests ---
+
+
+def test_serialize_output_mutation_does_not_leak() -> None:
+    """Changing a serialize() result leaves later output unchanged."""
+    expr = NamedOp(input=UnaryOp(input=F("x")), in_=1)
+    first = expr.serialize()
+    first["$named"]["input"]["$unary"] = "changed"
+    assert expr.serialize() == {"$named": {"input": {"$unary": "$x"}, "in": 1}}
+    assert expr.model_dump() == expr.serialize()
+
+
+def test_serialize_value_output_mutation_does_not_leak() -> None:
+    """Changing a serialized child does not affect parents built later."""
+    inner = UnaryOp(input=F("x"))
+    serialize_value(inner)["$unary"] = "changed"
+    expr = VariadicOp(items=[inner, 1])
+    assert expr.model_dump() == {"$variadic": [{"$unary": "$x"}, 1]}
+
+
+def test_model_dump_returns_fresh_copy() -> None:
+    """Changing a model_dump() result leaves later dumps unchanged."""
+    expr = UnaryOp(input=F("x"))
+    first = expr.model_dump()
+    first["$unary"] = "changed"
+    assert expr.model_dump() == {"$unary": "$x"}
+
+
+def test_serialize_reads_mutable_fields_each_time() -> None:
+    """Expressions holding lists reflect in-place changes."""
+    expr = VariadicOp(items=[F("a")])
+    expr.serialize()
+    expr.items.append(F("b"))
+    assert expr.serialize() == {"$variadic": ["$a", "$b"]}
+
+
+def test_serialize_tuple_fields() -> None:
+    """Tuple fields serialize like lists."""
+
+    class TupleOp(ExpressionBase):
+        items: tuple[Any, ...]
+
+        _op = "$tuple"
+        _layout = Layout.LIST
+        _args = ("items",)
+
+    expr = TupleOp(items=[F("a"), 1, UnaryOp(input=F("b"))])
+    assert expr.model_dump() == {"$tuple": ["$a", 1, {"$unary": "$b"}]}
+
+
+def test_model_copy_serializes_updated_fields() -> None:
+    """Copies with updated fields serialize their own values."""
+    expr = UnaryOp(input=F("x"))
+    expr.serialize()
+    copied = expr.model_copy(update={"input": F("y")})
+    assert copied.serialize() == {"$unary": "$y"}
+
+
+# --- to_dict Tests ---
+
+
+def test_to_dict_matches_model_dump() -> None:
+    """to_dict() produces the same output as model_dump()."""
+    expr = NamedOp(input=UnaryOp(input=F("x")), in_=[1, F("y")])
+    assert expr.to_dict() == expr.model_dump()
+
+
+def test_to_dict_returns_independent_copy() -> None:
+    """to_dict() output is not shared with the expression."""
+    inner = UnaryOp(input=F("x"))
+    expr = NamedOp(input=inner, in_=1)
+    result = expr.to_dict()
+    result["$named"]["input"]["$unary"] = "changed"
+    assert inner.serialize() == {"$unary": "$x"}
+    assert expr.to_dict() == {"$named": {"input": {"$unary": "$x"}, "in": 1}}
@@ -160,6 +160,14 @@ def test_switch_with_operator_expressions() -> None:
     assert result["$switch"]["default"] == "F"
 
 
+def test_switch_expr_tuple_branches() -> None:
+    """SwitchExpr accepts plain (case, then) tuples as branches."""
+    expr = SwitchExpr(branches=[(F("x") == 1, "one")])
+    assert expr.model_dump() == {
+        "$switch": {"branches": [{"case": {"$eq": ["$x", 1]}, "then": "one"}]}
+    }
+
+
 def test_switch_expr_missing_branches_raises() -> None:
     """SwitchExpr requires branches list."""
     with pytest.raises(ValidationError):
@@ -168,11 +176,11 @@ def test_switch_expr_missing_branches_raises() -> None:
 
 def test_switch_branch_missing_case_raises() -> None:
     """SwitchBranch requires case."""
-    with pytest.raises(ValidationError):
+    with pytest.raises(TypeError):
         SwitchBranch(then=1)  # type: ignore[call-arg]
 
 
 def test_switch_branch_missing_then_raises() -> None:
     """SwitchBranch requires then."""
-    with pytest.raises(ValidationError):
+    with pytest.raises(TypeError):
         SwitchBranch(case=EqExpr(left=F("x"), right=1))  # type: ignore[call-arg]
@@ -9,6 +9,7 @@ This module tests:
 - DateFromPartsExpr, DateToPartsExpr, DateTruncExpr
 """
 
+import sys
 from datetime import datetime
 
 import pytest
@@ -68,6 +69,12 @@ def test_date_add_expr_with_timezone() -> None:
     assert result["$dateAdd"]["timezone"] == "America/New_York"
 
 
+def test_date_add_expr_keeps_empty_timezone() -> None:
+    """Only None omits timezone; an empty string is passed through."""
+    expr = DateAddExpr(start_date=F("date"), unit="day", amount=1, timezone="")
+    assert expr.model_dump()["$dateAdd"]["timezone"] == ""
+
+
 def test_date_add_missing_unit_raises() -> None:
     """DateAddExpr requires unit."""
     with pytest.raises(ValidationError):
@@ -315,6 +322,22 @@ def test_date_from_parts_expr_iso() -> None:
     assert result["$dateFromParts"]["isoDayOfWeek"] == 1
 
 
+def test_date_from_parts_expr_time_parts() -> None:
+    """DateFromPartsExpr emits set parts in order and omits the rest."""
+    expr = DateFromPartsExpr(
+        year=F("y"), day=1, hour=12, millisecond=0, timezone="UTC"
+    )
+    assert expr.model_dump() == {
+        "$dateFromParts": {
+            "year": "$y",
+            "day": 1,
+            "hour": 12,
+            "millisecond": 0,
+            "timezone": "UTC",
+        }
+    }
+
+
 def test_date_from_parts_missing_year_raises() -> None:
     """DateFromPartsExpr requires year."""
     with pytest.raises(ValidationError):
@@ -364,6 +387,17 @@ def test_date_trunc_expr_with_options() -> None:
     assert result["$dateTrunc"]["startOfWeek"] == "monday"
 
 
+def test_date_trunc_interns_strings() -> None:
+    """DateTruncExpr stores unit, timezone and weekday interned."""
+    unit = "".join(["we", "ek"])
+    expr = DateTruncExpr(
+        date=F("timestamp"), unit=unit, start_of_week="monday"
+    )
+    assert expr.unit is sys.intern("week")
+    assert expr.start_of_week is sys.intern("monday")
+    assert expr.timezone is None
+
+
 def test_date_trunc_missing_unit_raises() -> None:
     """DateTruncExpr requires unit."""
     with pytest.raises(ValidationError):
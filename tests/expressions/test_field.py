@@ -7,7 +7,10 @@ This module tests:
 - Field hashability for use in sets/dicts
 """
 
-from mongo_aggro.expressions import F
+import sys
+from enum import StrEnum
+
+from mongo_aggro.expressions import F, Field
 
 # --- Field Creation Tests ---
 
@@ -36,6 +39,30 @@ def test_field_double_dollar_prefix() -> None:
     assert str(field) == "$$this.value"
 
 
+def test_f_returns_cached_instance() -> None:
+    """F returns the same Field for the same path."""
+    assert F("user.name") is F("user.name")
+    assert F("user.name") is not F("$user.name")
+
+
+def test_field_path_is_interned() -> None:
+    """Fields for the same path share one interned string."""
+    assert str(F("user.name")) is str(F("$user.name"))
+    assert str(F("user.name")) is sys.intern("$user.name")
+
+
+def test_field_accepts_str_enum() -> None:
+    """Field accepts str subclasses such as StrEnum members."""
+
+    class Path(StrEnum):
+        PREFIXED = "$a.b"
+        BARE = "c"
+
+    assert str(Field(Path.PREFIXED)) == "$a.b"
+    assert type(str(Field(Path.PREFIXED))) is str
+    assert str(F(Path.BARE)) is sys.intern("$c")
+
+
 # --- Field Repr Tests ---
 
 
@@ -157,6 +157,15 @@ def test_or_flattening() -> None:
     }
 
 
+def test_flattening_keeps_other_operators_nested() -> None:
+    """& does not flatten an OrExpr operand, and | does not flatten AND."""
+    either = (F("a") == 1) | (F("b") == 2)
+    both = (F("c") == 3) & either
+    assert len(both.conditions) == 2
+    assert both.conditions[1] is either
+    assert len((both | either).conditions) == 3
+
+
 # --- Deeply Nested Expressions Tests ---
 
 
@@ -234,3 +243,78 @@ def test_mixed_with_raw_dicts() -> None:
             {"$regex": {"input": "$name", "regex": "^test"}},
         ]
     }
+
+
+# --- Match Compilation Tests ---
+
+
+def test_and_to_match_dict_fuses_same_field() -> None:
+    """Comparisons on the same field fuse into one operator dict."""
+    expr = (F("age") > 18) & (F("age") < 65) & (F("status") == "active")
+    assert expr.to_match_dict() == {
+        "age": {"$gt": 18, "$lt": 65},
+        "status": {"$eq": "active"},
+    }
+
+
+def test_and_to_match_dict_cross_field_uses_expr() -> None:
+    """Field-to-field comparisons stay under $expr."""
+    expr = (F("a") == 1) & (F("b") > F("c"))
+    assert expr.to_match_dict() == {
+        "a": {"$eq": 1},
+        "$expr": {"$gt": ["$b", "$c"]},
+    }
+
+
+def test_and_to_match_dict_multiple_leftovers() -> None:
+    """Several non-fusible conditions are combined with $and."""
+    expr = (F("a") >= F("b")) & ((F("x") == 1) | (F("y") == 2))
+    assert expr.to_match_dict() == {
+        "$expr": {
+            "$and": [
+                {"$gte": ["$a", "$b"]},
+                {"$or": [{"$eq": ["$x", 1]}, {"$eq": ["$y", 2]}]},
+            ]
+        }
+    }
+
+
+def test_and_to_match_dict_repeated_operator() -> None:
+    """A repeated operator on one field falls back to $expr."""
+    expr = (F("n") > 1) & (F("n") > 5)
+    assert expr.to_match_dict() == {
+        "n": {"$gt": 1},
+        "$expr": {"$gt": ["$n", 5]},
+    }
+
+
+def test_and_to_match_dict_skips_non_literals() -> None:
+    """Path strings, None and containers are not fused."""
+    expr = (F("a") == "$b") & (F("c") == None) & (F("d") == [1])  # noqa
+    assert expr.to_match_dict() == {
+        "$expr": {
+            "$and": [
+                {"$eq": ["$a", "$b"]},
+                {"$eq": ["$c", None]},
+                {"$eq": ["$d", [1]]},
+            ]
+        }
+    }
+
+
+def test_and_to_match_dict_skips_tuples() -> None:
+    """Tuples are kept under $expr like lists."""
+    expr = (F("a") == (1, 2)) & (F("b") > 1)
+    result = expr.to_match_dict()
+    assert result["b"] == {"$gt": 1}
+    assert "a" not in result
+    assert result["$expr"]["$eq"][0] == "$a"
+
+
+def test_and_to_match_dict_keeps_serialize() -> None:
+    """to_match_dict does not change regular serialization."""
+    expr = (F("age") > 18) & (F("age") < 65)
+    expr.to_match_dict()
+    assert expr.model_dump() == {
+        "$and": [{"$gt": ["$age", 18]}, {"$lt": ["$age", 65]}]
+    }
@@ -200,6 +200,20 @@ def test_regex_match_missing_regex_raises() -> None:
         RegexMatchExpr(input=F("text"))  # type: ignore[call-arg]
 
 
+def test_regex_unknown_option_raises() -> None:
+    """Regex expressions reject options MongoDB does not support."""
+    with pytest.raises(ValidationError, match="unsupported regex options"):
+        RegexFindAllExpr(input=F("text"), regex=r"\w+", options="ig")
+
+
+def test_regex_pcre_pattern_accepted() -> None:
+    """PCRE-only syntax is passed through without local compilation."""
+    expr = RegexMatchExpr(input=F("name"), regex=r"^\p{Lu}", options="u")
+    assert expr.model_dump() == {
+        "$regexMatch": {"input": "$name", "regex": r"^\p{Lu}", "options": "u"}
+    }
+
+
 # --- Substring Expressions Tests ---
 
 
@@ -0,0 +1,60 @@
+"""Tests for variable expression operators.
+
+This module tests:
+- LiteralExpr and the shared literal() helper
+- RandExpr and the shared RAND instance
+"""
+
+from mongo_aggro.expressions import RAND, LiteralExpr, RandExpr, literal
+
+# --- literal Tests ---
+
+
+def test_literal_serialization() -> None:
+    """literal() builds a $literal expression."""
+    assert literal("$price").model_dump() == {"$literal": "$price"}
+
+
+def test_literal_reuses_scalar_instances() -> None:
+    """Equal scalars share one LiteralExpr instance."""
+    assert literal("$price") is literal("$price")
+
+
+def test_literal_distinguishes_scalar_types() -> None:
+    """Values that compare equal across types are not conflated."""
+    assert literal(1).model_dump() == {"$literal": 1}
+    assert literal(True).model_dump() == {"$literal": True}
+    assert literal(1) is not literal(True)
+    assert literal(1.0).value.__class__ is float
+
+
+def test_literal_keeps_signed_zero() -> None:
+    """literal() output does not depend on which zero was seen first."""
+    assert literal(-0.0).model_dump() == {"$literal": -0.0}
+    positive = literal(0.0).model_dump()["$literal"]
+    assert str(positive) == "0.0"
+    assert literal(0.0) is not literal(-0.0)
+
+
+def test_literal_floats_not_shared() -> None:
+    """literal() builds a new instance for every float, including NaN."""
+    nan = float("nan")
+    assert literal(1.5) is not literal(1.5)
+    assert literal(nan) is not literal(nan)
+
+
+def test_literal_containers_not_shared() -> None:
+    """Container values get their own instance."""
+    first = literal([1, 2])
+    assert isinstance(first, LiteralExpr)
+    assert first is not literal([1, 2])
+    assert first.model_dump() == {"$literal": [1, 2]}
+
+
+# --- RandExpr Tests ---
+
+
+def test_rand_serialization() -> None:
+    """RandExpr and RAND serialize to an empty $rand document."""
+    assert RandExpr().model_dump() == {"$rand": {}}
+    assert RAND.model_dump() == {"$rand": {}}
@@ -3,6 +3,7 @@
 import pytest
 from pydantic import ValidationError
 
+from mongo_aggro.expressions import F
 from mongo_aggro.operators.logical import And, Expr, Nor, Not, Or
 
 # --- And Operator Tests ---
@@ -137,6 +138,16 @@ def test_expr_complex() -> None:
     assert "$and" in result["$expr"]
 
 
+def test_expr_with_expression_object() -> None:
+    """$expr serializes expression objects into an independent dict."""
+    expression = (F("a") > 1) & (F("b") == "x")
+    first = Expr(expression=expression).model_dump()
+    first["$expr"]["$and"].clear()
+    assert Expr(expression=expression).model_dump() == {
+        "$expr": {"$and": [{"$gt": ["$a", 1]}, {"$eq": ["$b", "x"]}]}
+    }
+
+
 def test_expr_missing_expression() -> None:
     """$expr requires expression parameter."""
     with pytest.raises(ValidationError):
@@ -3,6 +3,7 @@
 import pytest
 from pydantic import ValidationError
 
+from mongo_aggro.expressions import F
 from mongo_aggro.stages import Count, Group, Limit, Match, Project, Skip, Sort
 
 # --- Match Tests ---
@@ -41,6 +42,42 @@ def test_match_logical_and() -> None:
     }
 
 
+def test_match_from_expr_keeps_expr_semantics() -> None:
+    """Match.from_expr wraps the expression in $expr by default."""
+    match = Match.from_expr((F("age") > 18) & (F("age") < 65))
+    assert match.model_dump() == {
+        "$match": {
+            "$expr": {"$and": [{"$gt": ["$age", 18]}, {"$lt": ["$age", 65]}]}
+        }
+    }
+
+
+def test_match_from_expr_less_than_matches_null_and_missing() -> None:
+    """$lt stays under $expr so null and missing fields still match."""
+    match = Match.from_expr(F("age") < 65)
+    assert match.model_dump() == {"$match": {"$expr": {"$lt": ["$age", 65]}}}
+
+
+def test_match_from_expr_eq_none_stays_expr() -> None:
+    """Comparing against None is never fused, even with fuse=True."""
+    match = Match.from_expr(F("age") == None, fuse=True)  # noqa: E711
+    assert match.model_dump() == {"$match": {"$expr": {"$eq": ["$age", None]}}}
+
+
+def test_match_from_expr_fuses_range() -> None:
+    """Match.from_expr(fuse=True) compiles comparisons to query shorthand."""
+    match = Match.from_expr((F("age") > 18) & (F("age") < 65), fuse=True)
+    assert match.model_dump() == {"$match": {"age": {"$gt": 18, "$lt": 65}}}
+
+
+def test_match_from_expr_single_expression() -> None:
+    """Match.from_expr(fuse=True) accepts a single non-AND expression."""
+    match = Match.from_expr(F("total") > F("limit"), fuse=True)
+    assert match.model_dump() == {
+        "$match": {"$expr": {"$gt": ["$total", "$limit"]}}
+    }
+
+
 def test_match_logical_or() -> None:
     """Match with $or operator."""
     match = Match(
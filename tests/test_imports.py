@@ -0,0 +1,63 @@
+"""Tests for package exports.
+
+This module tests:
+- Lazy loading of expression submodules
+- Resolution of every exported name
+- Agreement of the lazy export table with submodule exports
+"""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import mongo_aggro
+import mongo_aggro.expressions as expressions
+
+
+def test_import_does_not_load_operator_modules() -> None:
+    """Importing the package loads only the expression base."""
+    code = (
+        "import sys, mongo_aggro; "
+        "print(sorted(m for m in sys.modules "
+        "if m.startswith('mongo_aggro.expressions.')))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    assert output.strip() == "['mongo_aggro.expressions.base']"
+
+
+@pytest.mark.parametrize("module", [mongo_aggro, expressions])
+def test_all_names_resolve(module: object) -> None:
+    """Every name in __all__ is available as an attribute."""
+    for name in module.__all__:  # type: ignore[attr-defined]
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+
+
+@pytest.mark.parametrize("module", [mongo_aggro, expressions])
+def test_unknown_name_raises(module: object) -> None:
+    """Unknown attributes still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        getattr(module, "NoSuchExpr")
+
+
+def test_lazy_table_matches_submodule_exports() -> None:
+    """Each submodule's __all__ matches its lazy export table entry."""
+    for module, names in expressions._SUBMODULES.items():
+        submodule = importlib.import_module(
+            f"mongo_aggro.expressions.{module}"
+        )
+        assert sorted(submodule.__all__) == sorted(names), module
+    assert len(expressions.__all__) == len(set(expressions.__all__))
+
+
+def test_lazy_names_match_definitions() -> None:
+    """Lazily exported operators come from their defining module."""
+    assert expressions.YearExpr.__module__ == "mongo_aggro.expressions.date"
+    assert mongo_aggro.YearExpr is expressions.YearExpr
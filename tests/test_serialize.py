@@ -0,0 +1,115 @@
+"""Tests for serialize_value.
+
+This module tests:
+- Primitive leaves returned unchanged
+- Field references, expressions and nested containers
+- Bulk serialization of operand lists
+- Handler resolution for subclasses and unknown types
+- Independence of output from the serialized expression
+"""
+
+from enum import IntEnum
+from typing import Any
+
+import pytest
+from pydantic import model_serializer
+
+from mongo_aggro import serialize_many, serialize_value
+from mongo_aggro.expressions import AddExpr, AndExpr, F
+from mongo_aggro.expressions.base import ExpressionBase
+
+
+class Level(IntEnum):
+    """Int subclass used to check non-exact primitive types."""
+
+    HIGH = 2
+
+
+class CustomExpr(ExpressionBase):
+    """Expression whose model serializer is not named serialize."""
+
+    input: Any
+
+    @model_serializer
+    def to_mongo(self) -> dict[str, Any]:
+        return {"$custom": str(self.input)}
+
+
+# --- Primitive Tests ---
+
+
+@pytest.mark.parametrize("value", ["text", 1, 2.5, True, None])
+def test_serialize_primitive_identity(value: object) -> None:
+    """Primitive values are returned as the same object."""
+    assert serialize_value(value) is value
+
+
+def test_serialize_primitive_subclass() -> None:
+    """Subclasses of primitive types pass through unchanged."""
+    assert serialize_value(Level.HIGH) is Level.HIGH
+
+
+# --- Composite Tests ---
+
+
+def test_serialize_field() -> None:
+    """Field references serialize to their path."""
+    assert serialize_value(F("status")) == "$status"
+
+
+def test_serialize_nested_containers() -> None:
+    """Lists and dicts are serialized recursively."""
+    value = {"a": [F("x"), AddExpr(operands=[F("y"), 1])], "b": 2}
+    assert serialize_value(value) == {
+        "a": ["$x", {"$add": ["$y", 1]}],
+        "b": 2,
+    }
+
+
+def test_serialize_many_mixed_operands() -> None:
+    """serialize_many serializes literals, fields and expressions."""
+    operands = (F("a"), 1, AddExpr(operands=[F("b"), 2]))
+    assert serialize_many(operands) == ["$a", 1, {"$add": ["$b", 2]}]
+
+
+def test_serialize_many_empty() -> None:
+    """serialize_many returns a new empty list for no operands."""
+    assert serialize_many([]) == []
+
+
+def test_serialize_container_subclasses() -> None:
+    """Subclasses of list and dict are serialized like their bases."""
+
+    class Operands(list):  # type: ignore[type-arg]
+        """List subclass used to check handler resolution."""
+
+    assert serialize_value(Operands([F("a"), 1])) == ["$a", 1]
+
+
+def test_serialize_unknown_type_passthrough() -> None:
+    """Values of unrecognized types are returned unchanged."""
+    marker = object()
+    assert serialize_value(marker) is marker
+    assert serialize_value(marker) is marker
+
+
+def test_serialize_expression_output_is_independent() -> None:
+    """Appending to serialized operands does not change the expression."""
+    expr = AddExpr(operands=[F("a"), 1])
+    serialize_value(expr)["$add"].append(2)
+    assert serialize_value(expr) == {"$add": ["$a", 1]}
+    assert expr.model_dump() == {"$add": ["$a", 1]}
+
+
+def test_serialize_custom_named_serializer_nested() -> None:
+    """Expressions with a custom-named serializer work inside operators."""
+    custom = CustomExpr(input=F("a"))
+    assert serialize_value(custom) == {"$custom": "$a"}
+    assert AddExpr(operands=[custom, 1]).model_dump() == {
+        "$add": [{"$custom": "$a"}, 1]
+    }
+    expr = (F("b") > 1) & custom
+    assert isinstance(expr, AndExpr)
+    assert expr.model_dump() == {
+        "$and": [{"$gt": ["$b", 1]}, {"$custom": "$a"}]
+    }